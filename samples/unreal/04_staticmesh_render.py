@@ -29,6 +29,11 @@ seq_2_name = 'seq_staticmesh_2'
 def main(debug=False, background=False):
     logger = setup_logger(level='DEBUG' if debug else 'INFO', log_path=log_path)
     xf_runner = xf.init_unreal(exec_path=unreal_exec, project_path=unreal_project, background=background)
+    # render passes shared by all the sequences, `RenderPass` can only be created after `init_unreal`
+    render_passes = [
+        RenderPass('img', 'png'),
+        RenderPass('mask', 'exr'),  # in png format, annotations would apply gamma correction (2.2)
+    ]
 
     # duplicate the level to a new level
     xf_runner.utils.open_level(default_level_path)  # in case {dst_level_path} already opened
@@ -74,10 +79,7 @@ def main(debug=False, background=False):
         # add render job to renderer
         seq.add_to_renderer(
             output_path=output_path,
-            render_passes=[
-                RenderPass('img', 'png'),
-                RenderPass('mask', 'exr'),  # in png format, annotations would apply gamma correction (2.2)
-            ],
+            render_passes=render_passes,
             console_variables={'r.MotionBlurQuality': 0},  # disable motion blur
             resolution=[1280, 720],
             export_vertices=True,
@@ -119,10 +121,7 @@ def main(debug=False, background=False):
         # add render job to renderer
         seq.add_to_renderer(
             output_path=output_path,
-            render_passes=[
-                RenderPass('img', 'png'),
-                RenderPass('mask', 'exr'),  # in png format, annotations would apply gamma correction (2.2)
-            ],
+            render_passes=render_passes,
             console_variables={'r.MotionBlurQuality': 0},  # disable motion blur
             resolution=[1280, 720],
             export_vertices=True,
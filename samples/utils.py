@@ -9,9 +9,8 @@ import numpy as np
 from loguru import logger
 
 import xrfeitoria as xf
-from xrfeitoria.camera.camera_parameter import CameraParameter
-from xrfeitoria.utils import projector
 from xrfeitoria.utils import setup_logger as _setup_logger
+from xrfeitoria.utils.tools import LoggerWrapper
 
 try:
     from .config import blender_exec, unreal_exec, unreal_project
@@ -34,6 +33,9 @@ def visualize_vertices(camera_name, actor_names: List[str], seq_output_path: Pat
     except ImportError:
         logger.error('[red]Please install "Pillow" to visualize vertices:[/red] [bold]pip install Pillow[/bold]')
         exit(1)
+    # imported here since `xrprimer` is heavy and only needed for visualization
+    from xrfeitoria.camera.camera_parameter import CameraParameter
+    from xrfeitoria.utils import projector
 
     logger.info('Visualizing vertices')
     # fixed file structure
@@ -67,12 +69,21 @@ def visualize_vertices(camera_name, actor_names: List[str], seq_output_path: Pat
     logger.info(f'Overlap image saved to: "{save_path.as_posix()}"')
 
 
+_INFO_LEVEL_NO = logger.level('INFO').no
+_TIMING_ENABLED = os.environ.get('XRF_TIMING', '1') == '1'  # set `XRF_TIMING=0` to disable timing
+
+
 @contextmanager
 def __timer__(step_name: str):
-    t1 = time.time()
+    if not _TIMING_ENABLED:
+        yield
+        return
+    t1 = time.perf_counter()
     yield
-    t2 = time.time()
-    logger.info(f'⌛ {step_name} executed in {(t2-t1):.4f} s')
+    t2 = time.perf_counter()
+    # skip formatting and emitting the record when no handler accepts INFO
+    if LoggerWrapper.min_level_no is None or LoggerWrapper.min_level_no <= _INFO_LEVEL_NO:
+        logger.info(f'⌛ {step_name} executed in {(t2-t1):.4f} s')
 
 
 def parse_args():
@@ -10,6 +10,11 @@ import numpy as np
 from .. import logger
 from ..constants import MotionFrame, Tuple3
 
+# flip y and z axes, from blender camera view to opencv camera view
+R_BlenderView_to_OpenCVView = np.diag([1.0, -1.0, -1.0])
+# -90 deg rotation around x axis, to convert from blender to opencv coordinate system
+R_OFFSET_X = np.array([[1.0, 0.0, 0.0], [0.0, 0.0, 1.0], [0.0, -1.0, 0.0]])
+
 
 class SequenceProperties(NamedTuple):
     level: bpy.types.Scene
@@ -111,8 +116,8 @@ class XRFeitoriaBlenderFactory:
         sequence_collection = scene.level_properties.active_sequence
         if sequence_collection:
             return sequence_collection
-        elif scene.name in scene.collection.children.keys():
-            level_collection = XRFeitoriaBlenderFactory.get_collection(scene.name)
+        level_collection = scene.collection.children.get(scene.name)
+        if level_collection:
             return level_collection
         else:
             return scene.collection
@@ -230,9 +235,7 @@ class XRFeitoriaBlenderFactory:
         # set level actors' properties
         for actor_data in seq_collection.sequence_properties.level_actors:
             actor = actor_data.actor
-            actor.pass_index = actor_data.sequence_stencil_value
-            for child in actor.children_recursive:
-                child.pass_index = actor_data.sequence_stencil_value
+            XRFeitoriaBlenderFactory.set_pass_index(actor, actor_data.sequence_stencil_value)
             if actor_data.sequence_animation:
                 XRFeitoriaBlenderFactory.apply_action_to_actor(action=actor_data.sequence_animation, actor=actor)
 
@@ -271,9 +274,7 @@ class XRFeitoriaBlenderFactory:
                 # restore level actors' properties
                 for actor_data in collection.sequence_properties.level_actors:
                     actor = actor_data.actor
-                    actor.pass_index = actor_data.level_stencil_value
-                    for child in actor.children_recursive:
-                        child.pass_index = actor_data.level_stencil_value
+                    XRFeitoriaBlenderFactory.set_pass_index(actor, actor_data.level_stencil_value)
                     if actor_data.level_animation:
                         XRFeitoriaBlenderFactory.apply_action_to_actor(action=actor_data.level_animation, actor=actor)
                     else:
@@ -387,7 +388,7 @@ class XRFeitoriaBlenderFactory:
         # get collection
         if collection_name:
             collection = XRFeitoriaBlenderFactory.get_collection(collection_name)
-            if collection_name not in scene.collection.children.keys():
+            if scene.collection.children.get(collection_name) is None:
                 raise RuntimeError(
                     f"Collection '{collection_name}' does not exist in the current active scene, please link it to active scene first."
                 )
@@ -447,7 +448,8 @@ class XRFeitoriaBlenderFactory:
         Args:
             scene (bpy.types.Scene): The scene to be set as the active scene.
         """
-        bpy.context.window.scene = scene
+        if bpy.context.window.scene != scene:
+            bpy.context.window.scene = scene
 
     def set_collection_active(collection: 'bpy.types.Collection') -> None:
         """Set the given collection as the active collection.
@@ -455,11 +457,14 @@ class XRFeitoriaBlenderFactory:
         Args:
             collection (bpy.types.Collection): The collection to be set as the active collection.
         """
-        if collection.name in bpy.context.view_layer.layer_collection.children.keys():
-            layer_collection = bpy.context.view_layer.layer_collection.children[collection.name]
-            bpy.context.view_layer.active_layer_collection = layer_collection
-        elif collection.name == bpy.context.view_layer.layer_collection.name:
-            bpy.context.view_layer.active_layer_collection = bpy.context.view_layer.layer_collection
+        view_layer = bpy.context.view_layer
+        if view_layer.active_layer_collection.collection == collection:
+            return
+        layer_collection = view_layer.layer_collection.children.get(collection.name)
+        if layer_collection:
+            view_layer.active_layer_collection = layer_collection
+        elif collection.name == view_layer.layer_collection.name:
+            view_layer.active_layer_collection = view_layer.layer_collection
 
     def set_frame_range(scene: 'bpy.types.Scene', start: int, end: int) -> None:
         """Set the frame range of the given scene.
@@ -542,7 +547,7 @@ class XRFeitoriaBlenderFactory:
             collection (bpy.types.Collection): Collection.
             scene (bpy.types.Scene): Scene.
         """
-        if collection.name not in scene.collection.children.keys():
+        if collection.name not in scene.collection.children:
             scene.collection.children.link(collection)
 
     def unlink_collection_from_scene(
@@ -555,7 +560,7 @@ class XRFeitoriaBlenderFactory:
             collection (bpy.types.Collection): Collection.
             scene (bpy.types.Scene): Scene.
         """
-        if collection.name in scene.collection.children.keys():
+        if collection.name in scene.collection.children:
             scene.collection.children.unlink(collection)
 
     # --------- DELETE  -----------
@@ -565,7 +570,7 @@ class XRFeitoriaBlenderFactory:
         Args:
             seq_name (str): Name of the sequence.
         """
-        if seq_name in bpy.data.collections.keys():
+        if seq_name in bpy.data.collections:
             # delete all objects in seq_collection
             seq_collection = XRFeitoriaBlenderFactory.get_collection(name=seq_name)
             for obj in seq_collection.objects:
@@ -880,17 +885,15 @@ class XRFeitoriaBlenderFactory:
         Returns:
             np.ndarray: K.
         """
-        scene = bpy.context.scene
-        fov = cam.data.angle
-
-        resolution_x_in_px = scene.render.resolution_x
-        resolution_y_in_px = scene.render.resolution_y
-
-        focal = max(resolution_x_in_px, resolution_y_in_px) / 2 / math.tan(fov / 2)
-        u_0 = resolution_x_in_px / 2
-        v_0 = resolution_y_in_px / 2
-
-        K = np.array(((focal, 0, u_0), (0, focal, v_0), (0, 0, 1)))
+        render = bpy.context.scene.render
+        resolution_x_in_px = render.resolution_x
+        resolution_y_in_px = render.resolution_y
+
+        K = np.zeros((3, 3))
+        K[0, 0] = K[1, 1] = max(resolution_x_in_px, resolution_y_in_px) / 2 / math.tan(cam.data.angle / 2)
+        K[0, 2] = resolution_x_in_px / 2
+        K[1, 2] = resolution_y_in_px / 2
+        K[2, 2] = 1.0
         return K
 
     def get_R_T_matrix_from_blender(cam: 'bpy.types.Object') -> 'Tuple[np.ndarray, np.ndarray]':
@@ -902,10 +905,10 @@ class XRFeitoriaBlenderFactory:
         Returns:
             Tuple[np.array, np.array]: R, T.
         """
-        R_BlenderView_to_OpenCVView = np.diag([1, -1, -1])
-
-        location, rotation = cam.matrix_world.decompose()[:2]
-        R_BlenderView = rotation.to_matrix().transposed()
+        location = np.array(cam.matrix_world.translation)
+        # orthonormal rotation without the scale (negative or non-uniform), like ``decompose``
+        rotation = np.array(cam.matrix_world.to_quaternion().to_matrix())
+        R_BlenderView = rotation.T
 
         T_BlenderView = -1.0 * R_BlenderView @ location
 
@@ -923,16 +926,11 @@ class XRFeitoriaBlenderFactory:
         Returns:
             Tuple[np.ndarray, np.ndarray, np.ndarray]: K, R, T.
         """
-        import mathutils
-
         K = XRFeitoriaBlenderFactory.get_3x3_K_matrix_from_blender(cam)
         R, T = XRFeitoriaBlenderFactory.get_R_T_matrix_from_blender(cam)
 
-        # -90 deg rotation around x axis, to convert from blender to opencv coordinate system
-        _R = mathutils.Matrix(R)
-        _R_euler = _R.to_euler('XYZ')
-        _R_euler.x -= math.pi / 2
-        R = np.asarray(_R_euler.to_matrix())
+        # equals subtracting pi/2 from the 'XYZ' euler x angle, without the euler round-trip
+        R = np.asarray(R) @ R_OFFSET_X
         return K, R, T
 
     def add_multiview_camera(camera_name: str, scene: 'bpy.types.Scene') -> None:
@@ -942,7 +940,7 @@ class XRFeitoriaBlenderFactory:
             camera_name (str): Name of the camera.
             scene (bpy.types.Scene): Scene.
         """
-        if camera_name not in scene.render.views.keys():
+        if camera_name not in scene.render.views:
             render_view = scene.render.views.new(camera_name)
             render_view.file_suffix = camera_name
             render_view.camera_suffix = camera_name
@@ -969,11 +967,7 @@ class XRFeitoriaBlenderFactory:
         Returns:
             List[str]: Name of the active cameras.
         """
-        active_cameras = []
-        for cam in scene.render.views:
-            if cam.use is True:
-                active_cameras.append(cam.camera_suffix)
-        return active_cameras
+        return [cam.camera_suffix for cam in scene.render.views if cam.use]
 
     #####################################
     ############### Import ##############
@@ -1289,60 +1283,47 @@ class XRFeitoriaBlenderFactory:
             Tuple[Tuple[float, float, float], Tuple[float, float, float]]: Min and max point of the bounding box.
         """
         if obj.type == 'MESH':
-            depsgraph = bpy.context.evaluated_depsgraph_get()
-            evaluated_obj = obj.evaluated_get(depsgraph)
-            evaluated_mesh = evaluated_obj.data
-
-            vertex_positions = []
-            for vertex in evaluated_mesh.vertices:
-                vertex_position = obj.matrix_world @ vertex.co
-                vertex_positions.append(vertex_position)
-
-            bbox_min = (1e9, 1e9, 1e9)
-            bbox_max = (-1e9, -1e9, -1e9)
-            bbox_min = (
-                min(bbox_min[0], min(pos.x for pos in vertex_positions)),
-                min(bbox_min[1], min(pos.y for pos in vertex_positions)),
-                min(bbox_min[2], min(pos.z for pos in vertex_positions)),
-            )
-            bbox_max = (
-                max(bbox_max[0], max(pos.x for pos in vertex_positions)),
-                max(bbox_max[1], max(pos.y for pos in vertex_positions)),
-                max(bbox_max[2], max(pos.z for pos in vertex_positions)),
-            )
-            return bbox_min, bbox_max
+            meshes = [obj]
         elif obj.type == 'ARMATURE':
-            bbox_min = (1e9, 1e9, 1e9)
-            bbox_max = (-1e9, -1e9, -1e9)
-            for obj_mesh in obj.children:
-                depsgraph = bpy.context.evaluated_depsgraph_get()
-                evaluated_obj = obj_mesh.evaluated_get(depsgraph)
-                evaluated_mesh = evaluated_obj.data
-
-                vertex_positions = []
-                for vertex in evaluated_mesh.vertices:
-                    vertex_position = obj_mesh.matrix_world @ vertex.co
-                    vertex_positions.append(vertex_position)
-
-                bbox_min = (
-                    min(bbox_min[0], min(pos.x for pos in vertex_positions)),
-                    min(bbox_min[1], min(pos.y for pos in vertex_positions)),
-                    min(bbox_min[2], min(pos.z for pos in vertex_positions)),
-                )
-                bbox_max = (
-                    max(bbox_max[0], max(pos.x for pos in vertex_positions)),
-                    max(bbox_max[1], max(pos.y for pos in vertex_positions)),
-                    max(bbox_max[2], max(pos.z for pos in vertex_positions)),
-                )
-            return bbox_min, bbox_max
+            meshes = list(obj.children)
         else:
             raise ValueError(f'Invalid object type: {obj.type}')
 
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        bbox_min = np.full(3, 1e9)
+        bbox_max = np.full(3, -1e9)
+        for obj_mesh in meshes:
+            evaluated_mesh = obj_mesh.evaluated_get(depsgraph).data
+            # read all the vertices at once, and transform them to world space with a single matmul
+            vertex_positions = np.empty(len(evaluated_mesh.vertices) * 3, dtype=np.float64)
+            evaluated_mesh.vertices.foreach_get('co', vertex_positions)
+            vertex_positions = vertex_positions.reshape(-1, 3)
+            matrix_world = np.array(obj_mesh.matrix_world)
+            vertex_positions = vertex_positions @ matrix_world[:3, :3].T + matrix_world[:3, 3]
+
+            bbox_min = np.minimum(bbox_min, vertex_positions.min(axis=0))
+            bbox_max = np.maximum(bbox_max, vertex_positions.max(axis=0))
+        return tuple(bbox_min.tolist()), tuple(bbox_max.tolist())
+
+    def set_pass_index(obj: 'bpy.types.Object', pass_index: int) -> None:
+        """Set the pass index of the object and all its children.
+
+        ``children_recursive`` is gathered once, and only the objects whose pass index
+        differs are written, since every RNA write tags the object for a depsgraph update.
+
+        Args:
+            obj (bpy.types.Object): Object.
+            pass_index (int): Pass index.
+        """
+        for _obj in [obj, *obj.children_recursive]:
+            if _obj.pass_index != pass_index:
+                _obj.pass_index = pass_index
+
     #####################################
     ############# Material ##############
     #####################################
     def get_material(mat_name: str) -> 'bpy.types.Material':
-        if mat_name not in bpy.data.materials.keys():
+        if mat_name not in bpy.data.materials:
             raise ValueError(f"Material '{mat_name}' does not exists in this blend file.")
         return bpy.data.materials[mat_name]
 
@@ -90,6 +90,40 @@ def actor_test(debug: bool = False, background: bool = False):
                 ), f'name not match, actor.name={actor.name}'
                 actor.delete()
 
+        with __timer__('spawn many shapes'):
+            actors = xf_runner.Shape.spawn_many(
+                [
+                    dict(type='cube', location=(0, 0, 1), stencil_value=2),
+                    dict(type='cone', name='cone', rotation=(90, 0, 0), depth=1.0),
+                    dict(type='cone', name='cone_copy', depth=1.0),
+                ]
+            )
+            assert [actor.name for actor in actors] == [
+                xf_obj_name.format(obj_type='cube', obj_idx=1),
+                'cone',
+                'cone_copy',
+            ]
+            assert np.allclose(actors[1].dimensions, actors[2].dimensions), 'shapes of the same parameters differ'
+            assert np.allclose(actors[0].location, (0, 0, 1)), f'location: {actors[0].location}'
+            assert actors[0].stencil_value == 2, f'stencil_value: {actors[0].stencil_value}'
+            assert np.allclose(actors[1].rotation, (90, 0, 0)), f'rotation: {actors[1].rotation}'
+            for actor in actors:
+                actor.delete()
+
+        with __timer__('import many actors'):
+            actors = xf_runner.Actor.import_many([bunny_obj, bunny_obj], stencil_value=3)
+            assert len({actor.name for actor in actors}) == 2, f'names: {[actor.name for actor in actors]}'
+            assert xf_runner.Actor.get_stencil_values([actor.name for actor in actors]) == [3, 3]
+            for actor in actors:
+                actor.delete()
+
+        with __timer__('import many actors as instances'):
+            actors = xf_runner.Actor.import_many([bunny_obj, bunny_obj], stencil_value=4, instance=True)
+            assert xf_runner.Actor.get_stencil_values([actor.name for actor in actors]) == [4, 4]
+            assert actors[0].dimensions == actors[1].dimensions, 'Instanced actors should share their mesh'
+            for actor in actors:
+                actor.delete()
+
     logger.info('🎉 [bold green]actor tests passed!')
 
 
@@ -30,8 +30,8 @@ def seq_simple(xf_runner: XRFeitoriaBlender, seq_name: str = 'seq_simple'):
         seq.add_to_renderer(
             output_path=output_path / f'{seq.name}',
             render_passes=[
-                RenderPass('img', 'png'),
-                RenderPass('mask', 'exr'),
+                RenderPass.of('img', 'png'),
+                RenderPass.of('mask', 'exr'),
             ],
             resolution=[512, 512],
             render_engine='CYCLES',
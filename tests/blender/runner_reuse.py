@@ -0,0 +1,45 @@
+"""
+>>> python -m tests.blender.runner_reuse
+"""
+
+from xrfeitoria.utils import runner, setup_logger
+
+from ..utils import __timer__, _init_blender
+
+
+def runner_reuse_test(debug: bool = False, background: bool = False):
+    logger = setup_logger(level='DEBUG' if debug else 'INFO')
+    # same as `XRF_RUNNER_REUSE=1`, restored and the pool emptied afterwards not to leak into other tests
+    runner_reuse = runner.runner_reuse
+    runner.runner_reuse = True
+    try:
+        with __timer__('init_blender (new process)'):
+            with _init_blender(new_process=True, background=background) as xf_runner:
+                engine_pid = xf_runner._rpc_runner.engine_pid
+
+        # the engine process kept alive in the pool is taken over with `new_process=False`
+        with __timer__('init_blender (pooled process)'):
+            with _init_blender(new_process=False, background=background) as xf_runner:
+                assert xf_runner._rpc_runner.engine_pid == engine_pid, 'The pooled engine process is not reused'
+                assert xf_runner._rpc_runner.engine_process is not None
+
+        # and stopped with `new_process=True`, which asks for a fresh process
+        with __timer__('init_blender (fresh process)'):
+            with _init_blender(new_process=True, background=background) as xf_runner:
+                assert xf_runner._rpc_runner.engine_pid != engine_pid, 'The pooled engine process is reused'
+    finally:
+        runner.runner_reuse = runner_reuse
+        runner._stop_pooled_runners()
+
+    logger.info('🎉 [bold green]runner reuse tests passed!')
+
+
+if __name__ == '__main__':
+    import argparse
+
+    args = argparse.ArgumentParser()
+    args.add_argument('--debug', action='store_true')
+    args.add_argument('--background', '-b', action='store_true')
+    args = args.parse_args()
+
+    runner_reuse_test(debug=args.debug, background=args.background)
@@ -73,8 +73,8 @@ def seq_actor(xf_runner: XRFeitoriaBlender, seq_name: str = 'seq_actor'):
         seq.add_to_renderer(
             output_path=output_path / f'{seq.name}',
             render_passes=[
-                RenderPass('img', 'png'),
-                RenderPass('mask', 'png'),
+                RenderPass.of('img', 'png'),
+                RenderPass.of('mask', 'png'),
             ],
             resolution=[128, 128],
             render_engine='CYCLES',
@@ -116,11 +116,26 @@ def seq_shape(xf_runner: XRFeitoriaBlender, seq_name='seq_shape'):
             size=0.1,
             stencil_value=255,
         )
+        cubes = seq.spawn_shapes_with_keys(
+            [
+                {
+                    'type': 'cube',
+                    'transform_keys': [
+                        SeqTransKey(frame=0, location=(0, y, 1), rotation=(0, 0, 0), interpolation='AUTO'),
+                        SeqTransKey(frame=6, location=(0, y, -1), rotation=(0, 0, 90), interpolation='AUTO'),
+                    ],
+                    'size': 0.2,
+                    'stencil_value': 64,
+                }
+                for y in (-2, 2)
+            ]
+        )
+        assert len(cubes) == 2 and cubes[0].stencil_value == 64, 'Failed to spawn shapes with keys'
         seq.add_to_renderer(
             output_path=output_path / f'{seq.name}',
             render_passes=[
-                RenderPass('img', 'png'),
-                RenderPass('mask', 'exr'),
+                RenderPass.of('img', 'png'),
+                RenderPass.of('mask', 'exr'),
             ],
             resolution=[128, 128],
             render_engine='CYCLES',
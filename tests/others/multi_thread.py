@@ -1,23 +1,21 @@
 import os
 import subprocess
+import sys
+from typing import List
+
+processes: List[subprocess.Popen] = []
 
 
 def main(port: int = 50001):
-    if os.name == 'nt':
-        port_cmd = f'set BLENDER_PORT={port}'
-    else:
-        port_cmd = f'BLENDER_PORT={port}'
+    env = os.environ.copy()
+    env['BLENDER_PORT'] = str(port)
 
-    cmds = [
-        port_cmd,
-        '&&',
-        'python',
+    cmd = [
+        sys.executable,
         '-c',
-        '"import xrfeitoria as xf; xf.init_blender(background=True).close()"',
+        'import xrfeitoria as xf; xf.init_blender(background=True).close()',
     ]
-    cmd = ' '.join(cmds)
-    print(cmd)
-    p = subprocess.Popen(cmd, shell=True)
+    processes.append(subprocess.Popen(cmd, env=env))
 
 
 if __name__ == '__main__':
@@ -25,3 +23,5 @@ if __name__ == '__main__':
     main(50001)
     main(50002)
     main(50003)
+    for p in processes:
+        p.wait()
@@ -0,0 +1,82 @@
+"""
+>>> python -m tests.others.rpc_code
+
+Generate the code sent to the engine for every remote function, without an engine.
+"""
+
+import ast
+import builtins
+import importlib
+import inspect
+import pkgutil
+from typing import Callable, Iterator, List, Tuple
+
+from loguru import logger
+
+import xrfeitoria
+from xrfeitoria.rpc import factory
+from xrfeitoria.rpc.factory import RPCFactory
+
+
+def _iter_remote_functions() -> Iterator[Tuple[str, Callable, List[str]]]:
+    """Yield the name, the original function and the default imports of every remote function."""
+    for module_info in pkgutil.walk_packages(xrfeitoria.__path__, prefix='xrfeitoria.'):
+        try:
+            module = importlib.import_module(module_info.name)
+        except Exception as e:  # e.g. optional dependencies that are not installed
+            logger.warning(f'Skip "{module_info.name}": {e!r}')
+            continue
+        owners = [module] + [
+            obj for obj in vars(module).values() if inspect.isclass(obj) and obj.__module__ == module.__name__
+        ]
+        for owner in owners:
+            for name, obj in vars(owner).items():
+                obj = getattr(owner, name) if isinstance(obj, staticmethod) else obj
+                # the wrapper of `remote_call`, see `xrfeitoria.rpc.factory`
+                if not inspect.isfunction(obj) or obj.__code__.co_filename != factory.__file__:
+                    continue
+                if obj.__code__.co_name != 'wrapper':  # e.g. `remote_call` itself in `xrfeitoria.rpc.factory`
+                    continue
+                default_imports = inspect.getclosurevars(obj).nonlocals['default_imports'] or []
+                yield f'{module.__name__}.{obj.__wrapped__.__qualname__}', obj.__wrapped__, default_imports
+
+
+def _unresolved_names(code: str, function: Callable) -> set:
+    """Names of the client module used by the code but not imported in it."""
+    tree = ast.parse(code)
+    defined = set(dir(builtins))
+    used = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name):
+            (used if isinstance(node.ctx, ast.Load) else defined).add(node.id)
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            defined.update((alias.asname or alias.name).split('.')[0] for alias in node.names)
+        elif isinstance(node, (ast.FunctionDef, ast.Lambda)):
+            args = node.args
+            defined.update(arg.arg for arg in args.posonlyargs + args.args + args.kwonlyargs)
+            defined.update(arg.arg for arg in (args.vararg, args.kwarg) if arg)
+        elif isinstance(node, ast.ExceptHandler) and node.name:
+            defined.add(node.name)
+    return (used - defined) & set(vars(inspect.getmodule(function)))
+
+
+def test_get_code():
+    failed = []
+    count = 0
+    for name, function, default_imports in _iter_remote_functions():
+        count += 1
+        RPCFactory.default_imports = default_imports
+        try:
+            code = '\n'.join(RPCFactory._get_code(function))
+            unresolved = _unresolved_names(code, function)
+            assert not unresolved, f'names not imported in the engine: {sorted(unresolved)}'
+        except Exception as e:
+            failed.append(f'{name}: {e!r}')
+    RPCFactory.clear()
+    assert count > 0, 'No remote function found'
+    assert not failed, f'{len(failed)} remote function(s) can not be sent to the engine:\n' + '\n'.join(failed)
+    logger.info(f'Generated the code of {count} remote functions')
+
+
+if __name__ == '__main__':
+    test_get_code()
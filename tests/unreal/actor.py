@@ -61,12 +61,20 @@ def actor_test(debug: bool = False, background: bool = False):
         actor.delete()
 
         with __timer__('spawn shape'):
-            for _type in ['cube', 'sphere', 'cylinder', 'cone', 'plane']:
-                actor = xf_runner.Shape.spawn(type=_type)
-                assert actor.name == xf_obj_name.format(
-                    obj_type=_type, obj_idx=1
-                ), f'name not match, actor.name={actor.name}'
-                actor.delete()
+            types = ['cube', 'sphere', 'cylinder', 'cone', 'plane']
+            actors = xf_runner.Shape.spawn_many(types)
+            names = [actor.name for actor in actors]
+            assert names == [
+                xf_obj_name.format(obj_type=_type, obj_idx=1) for _type in types
+            ], f'name not match, names={names}'
+            xf_runner.Shape.delete_many(actors)
+
+        with __timer__('spawn shape batch'):
+            transforms = [((i, 0, 0), (0, 0, 0), (0.5, 0.5, 0.5)) for i in range(3)]
+            actors = xf_runner.Shape.spawn_batch('cube', transforms)
+            assert len(actors) == 3, f'actors={actors}'
+            assert np.allclose(actors[2].location, (2, 0, 0)), f'location not match, loc={actors[2].location}'
+            xf_runner.Shape.delete_many(actors)
 
     logger.info('🎉 [bold green]actor tests passed!')
 
@@ -2,6 +2,7 @@
 >>> python -m tests.unreal.audio
 """
 
+from functools import lru_cache
 from pathlib import Path
 
 from xrfeitoria.data_structure.models import RenderPass
@@ -10,12 +11,17 @@ from xrfeitoria.utils import setup_logger
 from ..config import assets_path
 from ..utils import __timer__, _init_unreal
 
-root = Path(__file__).resolve().parents[2]
-output_path = root / 'output' / Path(__file__).relative_to(root).with_suffix('')
 seq_name = 'seq_audio'
 wave_path = Path(assets_path['audio'])
 
 
+@lru_cache(maxsize=1)
+def _output_path() -> Path:
+    root = Path(__file__).resolve().parents[2]
+    # output_path = '~/xrfeitoria/output/tests/unreal/{file_name}'
+    return root / 'output' / Path(__file__).relative_to(root).with_suffix('')
+
+
 def audio_test(debug: bool = False, background: bool = False):
     logger = setup_logger(level='DEBUG' if debug else 'INFO')
     with _init_unreal(background=background) as xf_runner:
@@ -37,9 +43,9 @@ def audio_test(debug: bool = False, background: bool = False):
         with __timer__('add to renderer'):
             seq.spawn_camera()
             seq.add_to_renderer(
-                output_path=output_path,
+                output_path=_output_path(),
                 resolution=(640, 360),
-                render_passes=[RenderPass('img', 'png')],
+                render_passes=[RenderPass.of('img', 'png')],
                 export_audio=True,
             )
         with __timer__('save seq'):
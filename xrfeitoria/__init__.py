@@ -1,26 +1,58 @@
+import threading
+
 __all__ = ['__version__', 'init_blender', 'init_unreal']
 
 
-class CacheThread:
+class CacheThread(threading.local):
+    """Thread-local cache of the engine in use, e.g. ``platform`` and ``engine_process``.
+
+    ``cache`` is initialized empty once per thread on first access, so a runner started
+    in one thread is not visible to other threads. For instance, creating a ``RenderPass``
+    in another thread asserts that ``init_blender`` or ``init_unreal`` must be called first.
+    Worker threads using the engine should call :meth:`inherit` with the cache of the
+    thread that started the runner.
+    """
+
     def __init__(self):
-        self.global_vars = {}
+        self.cache = {}
 
-    @property
-    def cache(self):
-        return self.global_vars
+    def inherit(self, cache: dict) -> None:
+        """Copy the cache of another thread into the cache of the current thread.
 
+        Args:
+            cache (dict): the cache of another thread, e.g. ``dict(_tls.cache)`` taken in that thread.
+        """
+        self.cache.update(cache)
 
-def _get_version() -> str:
-    from importlib.metadata import PackageNotFoundError, version
 
+def _get_version() -> str:
+    # `version.py` is written by setuptools-scm at build time, reading it avoids parsing the package metadata
     try:
-        __version__ = version(__package__)
-    except PackageNotFoundError:
-        __version__ = 'unknown'
+        from .version import version as __version__
+    except ImportError:
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            __version__ = version(__package__)
+        except PackageNotFoundError:
+            __version__ = 'unknown'
 
     return __version__
 
 
 _tls = CacheThread()
 __version__ = _get_version()  # e.g. '0.5.0'
-from .factory import init_blender, init_unreal
+
+
+def __getattr__(name: str):
+    # lazily import `.factory`, which pulls in the rpc stack, runner and engine wrappers
+    if name in ('init_blender', 'init_unreal'):
+        from . import factory
+
+        globals().update(init_blender=factory.init_blender, init_unreal=factory.init_unreal)
+        return globals()[name]
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted(list(globals()) + ['init_blender', 'init_unreal'])
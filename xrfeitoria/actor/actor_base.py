@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from loguru import logger
 
@@ -13,6 +13,7 @@ from ..utils import Validator
 class ActorBase(ABC, ObjectBase):
     """Base class for all actors in the world."""
 
+    __slots__ = ()
     _object_utils = ObjectUtilsBase
 
     @property
@@ -47,6 +48,40 @@ class ActorBase(ABC, ObjectBase):
         """
         return self._get_mask_color_in_engine(self.name)
 
+    @classmethod
+    def get_stencil_values(cls, actor_names: List[str]) -> List[int]:
+        """Get the stencil values of multiple actors with a single RPC call.
+
+        Args:
+            actor_names (List[str]): Names of the actors.
+
+        Returns:
+            List[int]: Stencil values of the actors, in the same order as ``actor_names``.
+        """
+        return cls._get_stencil_values_in_engine(actor_names)
+
+    @classmethod
+    def set_stencil_values(cls, stencil_values: Dict[str, int]) -> None:
+        """Set the stencil values of multiple actors with a single RPC call.
+
+        Args:
+            stencil_values (Dict[str, int]): Mapping from actor names to stencil values in [0, 255].
+        """
+        cls._set_stencil_values_in_engine(stencil_values)
+
+    @classmethod
+    def get_mask_colors(cls, actor_names: List[str]) -> List[Vector]:
+        """Get the mask colors of multiple actors with a single RPC call.
+
+        Args:
+            actor_names (List[str]): Names of the actors.
+
+        Returns:
+            List[Vector]: Mask colors of the actors, in the same order as ``actor_names``.
+                RGB values (int) in [0, 255].
+        """
+        return cls._get_mask_colors_in_engine(actor_names)
+
     @classmethod
     def import_from_file(
         cls,
@@ -81,18 +116,41 @@ class ActorBase(ABC, ObjectBase):
         if actor_name is None:
             actor_name = cls._object_utils.generate_obj_name(obj_type='actor')
         cls._object_utils.validate_new_name(actor_name)
-        if location:
-            Validator.validate_vector(location, 3)
-        if rotation:
-            Validator.validate_vector(rotation, 3)
-        if scale:
-            Validator.validate_vector(scale, 3)
+        Validator.validate_vectors([location, rotation, scale], 3, allow_none=True)
 
         # judge file path
         file_path = Path(file_path).resolve()
         if not file_path.exists():
             raise FileNotFoundError(f'File "{file_path.as_posix()}" is not found')
 
+        actor = cls._import_from_file(
+            file_path=file_path,
+            actor_name=actor_name,
+            location=location,
+            rotation=rotation,
+            scale=scale,
+            stencil_value=stencil_value,
+        )
+        logger.opt(lazy=True).info(
+            '[cyan]Imported[/cyan] actor "{}" from "{}"', lambda: actor_name, lambda: file_path.as_posix()
+        )
+        return actor
+
+    @classmethod
+    def _import_from_file(
+        cls,
+        file_path: Path,
+        actor_name: str,
+        location: 'Optional[Vector]' = None,
+        rotation: 'Optional[Vector]' = None,
+        scale: 'Optional[Vector]' = None,
+        stencil_value: int = 1,
+    ) -> 'ActorBase':
+        """Import the actor and set its transform and stencil value, with validated
+        arguments.
+
+        Subclasses may override this to do it with fewer RPC calls.
+        """
         cls._import_actor_from_file_in_engine(file_path=file_path, actor_name=actor_name)
         actor = cls(actor_name)
         if location:
@@ -102,7 +160,6 @@ class ActorBase(ABC, ObjectBase):
         if scale:
             actor.scale = scale
         actor.stencil_value = stencil_value
-        logger.info(f'[cyan]Imported[/cyan] actor "{actor_name}" from "{Path(file_path).as_posix()}"')
         return actor
 
     def setup_animation(self, animation_path: 'PathLike', action_name: 'Optional[str]' = None) -> None:
@@ -119,14 +176,18 @@ class ActorBase(ABC, ObjectBase):
             animation_path (PathLike): Animation file path.
             action_name (Optional[str], optional): Name of the action in the animation file. Only required when the file type is `.blend `. Defaults to None.
         """
-        Validator.validate_argument_type(animation_path, [str, Path])
+        if isinstance(animation_path, Path):
+            animation_path = animation_path.as_posix()
+        elif not isinstance(animation_path, str):
+            Validator.validate_argument_type(animation_path, [str, Path])  # raises TypeError
         self._import_animation_from_file_in_engine(
             animation_path=animation_path, actor_name=self.name, action_name=action_name
         )
-        logger.info(
-            f'[cyan]Imported[/cyan] animation '
-            f'{action_name if action_name is not None else ""}'
-            f'from "{animation_path}" and setup for actor "{self.name}"'
+        logger.opt(lazy=True).info(
+            '[cyan]Imported[/cyan] animation {}from "{}" and setup for actor "{}"',
+            lambda: action_name if action_name is not None else '',
+            lambda: animation_path,
+            lambda: self.name,
         )
 
     def __repr__(self) -> str:
@@ -145,11 +206,26 @@ class ActorBase(ABC, ObjectBase):
     def _get_mask_color_in_engine(actor_name: str) -> 'Vector':
         raise NotImplementedError
 
+    @staticmethod
+    @abstractmethod
+    def _get_stencil_values_in_engine(actor_names: 'List[str]') -> 'List[int]':
+        raise NotImplementedError
+
+    @staticmethod
+    @abstractmethod
+    def _get_mask_colors_in_engine(actor_names: 'List[str]') -> 'List[Vector]':
+        raise NotImplementedError
+
     @staticmethod
     @abstractmethod
     def _set_stencil_value_in_engine(actor_name: str, value: int) -> int:
         raise NotImplementedError
 
+    @staticmethod
+    @abstractmethod
+    def _set_stencil_values_in_engine(stencil_values: 'Dict[str, int]') -> None:
+        raise NotImplementedError
+
     @staticmethod
     @abstractmethod
     def _import_actor_from_file_in_engine(
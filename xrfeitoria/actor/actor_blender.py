@@ -1,9 +1,11 @@
+import math
+import os
 from pathlib import Path
-from typing import Dict, Literal, Optional, Tuple
+from typing import Dict, List, Literal, Optional, Tuple
 
 from loguru import logger
 
-from ..data_structure.constants import Vector, default_level_blender
+from ..data_structure.constants import PathLike, Vector
 from ..material.material_blender import MaterialBlender
 from ..object.object_utils import ObjectUtilsBlender
 from ..rpc import remote_blender
@@ -12,21 +14,132 @@ from ..utils.functions import blender_functions
 from .actor_base import ActorBase
 
 try:
+    import bmesh  # isort:skip
     import bpy  # isort:skip
     from XRFeitoriaBpy.core.factory import XRFeitoriaBlenderFactory  # defined in src/XRFeitoriaBpy/core/factory.py
 except ModuleNotFoundError:
     pass
 
 try:
-    from ..data_structure.models import TransformKeys  # isort:skip
+    from ..data_structure.models import SequenceTransformKey, TransformKeys  # isort:skip
 except (ImportError, ModuleNotFoundError):
     pass
 
+# animation importers of `XRFeitoriaBlenderFactory` by file extension: (method name, argument name of the file path)
+_ANIM_IMPORTERS = {
+    '.json': ('import_mo_json', 'mo_json_file'),
+    '.blend': ('import_mo_blend', 'mo_blend_file'),
+    '.fbx': ('import_mo_fbx', 'mo_fbx_file'),
+}
+
+# mesh builders of shapes by type, with the same sizes as `bpy.ops.mesh.primitive_*_add`
+_SHAPE_BUILDERS = {
+    'plane': lambda bm, size=1.0, **_: bmesh.ops.create_grid(
+        bm, x_segments=1, y_segments=1, size=size / 2, calc_uvs=True
+    ),
+    'cube': lambda bm, size=1.0, **_: bmesh.ops.create_cube(bm, size=size, calc_uvs=True),
+    'sphere': lambda bm, segments=32, ring_count=16, radius=1.0, **_: bmesh.ops.create_uvsphere(
+        bm, u_segments=segments, v_segments=ring_count, radius=radius, calc_uvs=True
+    ),
+    'ico_sphere': lambda bm, subdivisions=2, radius=1.0, **_: bmesh.ops.create_icosphere(
+        bm, subdivisions=subdivisions, radius=radius, calc_uvs=True
+    ),
+    'cylinder': lambda bm, vertices=32, radius=1.0, depth=2.0, **_: bmesh.ops.create_cone(
+        bm, cap_ends=True, segments=vertices, radius1=radius, radius2=radius, depth=depth, calc_uvs=True
+    ),
+    'cone': lambda bm, vertices=32, radius1=0.0, radius2=2.0, depth=2.0, **_: bmesh.ops.create_cone(
+        bm, cap_ends=True, segments=vertices, radius1=radius1, radius2=radius2, depth=depth, calc_uvs=True
+    ),
+}
+
+
+def _new_shape_mesh(name: str, type: str, **params) -> 'bpy.types.Mesh':
+    """Build the mesh of a shape with bmesh. Only works in Blender."""
+    build_mesh = _SHAPE_BUILDERS.get(type)
+    if build_mesh is None:
+        raise TypeError(
+            f'Unsupported mesh type, expected "plane", "cube", "sphere", '
+            f'"ico_sphere", "cylinder" or "cone", (got "{type}" instead).'
+        )
+
+    bm = bmesh.new()
+    bm.loops.layers.uv.new('UVMap')
+    try:
+        build_mesh(bm, **params)
+        mesh = bpy.data.meshes.new(name)
+        bm.to_mesh(mesh)
+    finally:
+        bm.free()
+    return mesh
+
+
+def _new_shape_object(
+    collection: 'bpy.types.Collection',
+    name: str,
+    type: str,
+    location: 'Optional[Vector]' = None,
+    rotation: 'Optional[Vector]' = None,
+    scale: 'Optional[Vector]' = None,
+    stencil_value: 'Optional[int]' = None,
+    templates: 'Optional[Dict[Tuple, bpy.types.Mesh]]' = None,
+    **params,
+) -> None:
+    """Build the mesh of a shape and link a new object of it to the collection. Only
+    works in Blender.
+
+    The mesh is built with bmesh and the object is created with the data API, which
+    avoids the operator overhead (undo push, depsgraph update) of ``bpy.ops``. When
+    ``templates`` is given, a shape of the same type and parameters as an earlier one
+    gets a copy of the earlier mesh instead of building it again.
+    """
+    if templates is None:
+        mesh = _new_shape_mesh(name, type, **params)
+    else:
+        key = (type, tuple(sorted(params.items())))
+        if key in templates:
+            mesh = templates[key].copy()
+            mesh.name = name
+        else:
+            mesh = templates[key] = _new_shape_mesh(name, type, **params)
+
+    obj = bpy.data.objects.new(name, mesh)
+    obj.rotation_mode = 'XYZ'
+    if location is not None:
+        obj.location = location
+    if rotation is not None:
+        obj.rotation_euler = [math.radians(r) for r in rotation]  # convert to radians
+    if scale is not None:
+        obj.scale = scale
+    if stencil_value is not None:
+        obj.pass_index = stencil_value
+    collection.objects.link(obj)
+
+
+def _instance_object_hierarchy(
+    source: 'bpy.types.Object', name: str, collection: 'bpy.types.Collection'
+) -> 'bpy.types.Object':
+    """Create a linked duplicate of the object and its children, which shares their
+    data (meshes, armatures and materials) instead of copying it. Only works in
+    Blender."""
+    # `Object.copy` keeps the data of the object, like `Alt+D` in the UI
+    copies = {obj: obj.copy() for obj in [source, *source.children_recursive]}
+    for obj, copy in copies.items():
+        # point the copies to each other instead of the source hierarchy
+        if obj.parent in copies:
+            copy.parent = copies[obj.parent]
+        for modifier in copy.modifiers:
+            if getattr(modifier, 'object', None) in copies:
+                modifier.object = copies[modifier.object]
+        collection.objects.link(copy)
+    copies[source].name = name
+    return copies[source]
+
 
 @remote_blender(dec_class=True, suffix='_in_engine')
 class ActorBlender(ActorBase):
     """Actor class for Blender."""
 
+    __slots__ = ()
     _object_utils = ObjectUtilsBlender
 
     def set_origin_to_center(self) -> None:
@@ -39,14 +152,66 @@ class ActorBlender(ActorBase):
         Args:
             transform_keys (List[Dict]): Keyframes of transform (frame, location, rotation, scale, and interpolation).
         """
-        if not isinstance(transform_keys, list):
-            transform_keys = [transform_keys]
-        transform_keys = [i.model_dump() for i in transform_keys]
-        self._object_utils.set_transform_keys(name=self.name, transform_keys=transform_keys)
+        self._object_utils.set_transform_keys(name=self.name, transform_keys=SequenceTransformKey.pack(transform_keys))
 
     def set_material(self, mat: MaterialBlender) -> None:
         self._set_material_in_engine(actor_name=self.name, mat_name=mat._name)
 
+    @classmethod
+    def _import_from_file(
+        cls,
+        file_path: Path,
+        actor_name: str,
+        location: 'Optional[Vector]' = None,
+        rotation: 'Optional[Vector]' = None,
+        scale: 'Optional[Vector]' = None,
+        stencil_value: int = 1,
+    ) -> 'ActorBlender':
+        # import the actor and set its transform and stencil value in a single RPC call
+        cls._import_actor_from_file_in_engine(
+            file_path=file_path,
+            actor_name=actor_name,
+            location=location or None,
+            rotation=rotation or None,
+            scale=scale or None,
+            stencil_value=stencil_value,
+        )
+        return cls(actor_name)
+
+    @classmethod
+    def import_many(
+        cls, file_paths: 'List[PathLike]', stencil_value: int = 1, instance: bool = False
+    ) -> 'List[ActorBlender]':
+        """Imports actors from multiple files with a single RPC call and returns their
+        corresponding actors.
+
+        Names are generated in the engine in the same way as :meth:`import_from_file`.
+
+        Args:
+            file_paths (List[PathLike]): the paths to the actor files.
+            stencil_value (int in [0, 255], optional): Stencil value of the actors. Defaults to 1.
+                Ref to :ref:`FAQ-stencil-value` for details.
+            instance (bool, optional): If True, a file listed more than once is read only once, and the other
+                actors of it are linked duplicates sharing its mesh, armature and material data, so editing the
+                data of one of them changes all of them. Defaults to False.
+
+        Returns:
+            List[ActorBlender]: the actors, in the same order as ``file_paths``.
+        """
+        file_paths = [Path(file_path).resolve() for file_path in file_paths]
+        for file_path in file_paths:
+            if not file_path.exists():
+                raise FileNotFoundError(f'File "{file_path.as_posix()}" is not found')
+
+        names = cls._import_actors_from_files_in_engine(
+            file_paths=[file_path.as_posix() for file_path in file_paths],
+            stencil_value=stencil_value,
+            instance=instance,
+        )
+        for name, file_path in zip(names, file_paths):
+            logger.info(f'[cyan]Imported[/cyan] actor "{name}" from "{file_path.as_posix()}"')
+        return [cls(name) for name in names]
+
     #####################################
     ###### RPC METHODS (Private) ########
     #####################################
@@ -76,6 +241,30 @@ class ActorBlender(ActorBase):
         pass_index = ActorBlender._get_stencil_value_in_engine(actor_name=actor_name)
         return (pass_index, pass_index, pass_index)
 
+    @staticmethod
+    def _get_stencil_values_in_engine(actor_names: 'List[str]') -> 'List[int]':
+        """Get stencil values (pass index) of the actors in Blender.
+
+        Args:
+            actor_names (List[str]): Names of the actors.
+
+        Returns:
+            List[int]: Stencil values (pass index).
+        """
+        return [bpy.data.objects[actor_name].pass_index for actor_name in actor_names]
+
+    @staticmethod
+    def _get_mask_colors_in_engine(actor_names: 'List[str]') -> 'List[Vector]':
+        """Get mask colors of the actors in Blender.
+
+        Args:
+            actor_names (List[str]): Names of the actors.
+
+        Returns:
+            List[Vector]: Mask colors. (r, g, b) in [0, 255].
+        """
+        return [ActorBlender._get_mask_color_in_engine(actor_name=actor_name) for actor_name in actor_names]
+
     @staticmethod
     def _set_stencil_value_in_engine(actor_name: str, value: int) -> int:
         """Set pass index (stencil value) of the actor in Blender.
@@ -84,19 +273,48 @@ class ActorBlender(ActorBase):
             actor_name (str): Name of the actor.
             value (int in [0, 255]): Pass index (stencil value).
         """
-        object = bpy.data.objects[actor_name]
-        object.pass_index = value
-        for child in object.children_recursive:
-            child.pass_index = value
+        XRFeitoriaBlenderFactory.set_pass_index(bpy.data.objects[actor_name], value)
+
+    @staticmethod
+    def _set_stencil_values_in_engine(stencil_values: 'Dict[str, int]') -> None:
+        """Set pass indexes (stencil values) of the actors in Blender, walking
+        ``bpy.data.objects`` only once.
+
+        Args:
+            stencil_values (Dict[str, int]): Mapping from actor names to pass indexes (stencil values).
+        """
+        for actor_name in stencil_values:
+            if actor_name not in bpy.data.objects:
+                raise KeyError(f'Actor "{actor_name}" not found')
+        for object in bpy.data.objects:
+            # the nearest ancestor (or itself) in the mapping decides the pass index
+            ancestor = object
+            while ancestor is not None and ancestor.name not in stencil_values:
+                ancestor = ancestor.parent
+            if ancestor is not None and object.pass_index != stencil_values[ancestor.name]:
+                object.pass_index = stencil_values[ancestor.name]
 
     @staticmethod
-    def _import_actor_from_file_in_engine(file_path: str, actor_name: str, collection_name: str = None) -> None:
+    def _import_actor_from_file_in_engine(
+        file_path: str,
+        actor_name: str,
+        collection_name: str = None,
+        location: 'Optional[Vector]' = None,
+        rotation: 'Optional[Vector]' = None,
+        scale: 'Optional[Vector]' = None,
+        stencil_value: 'Optional[int]' = None,
+    ) -> None:
         """Import actor from file.
 
         Args:
             path (str): File path used of the actor. Support: fbx | obj | alembic.
             name (str): Name of the actor in Blender.
             collection_name (str, optional): Name of the collection to import the actor to.
+            location (Optional[Vector], optional): Location of the actor. Defaults to None (keep the imported one).
+            rotation (Optional[Vector], optional): Rotation of the actor. Defaults to None (keep the imported one).
+            scale (Optional[Vector], optional): Scale of the actor. Defaults to None (keep the imported one).
+            stencil_value (Optional[int], optional): Pass index (stencil value) of the actor and its children.
+                Defaults to None.
         Raises:
             TypeError: If 'path' is not `fbx | obj | alembic | ply | stl` file.
         """
@@ -107,6 +325,45 @@ class ActorBlender(ActorBase):
         with XRFeitoriaBlenderFactory.__judge__(name=actor_name, import_path=file_path, scene=scene):
             blender_functions.import_file(file_path=file_path)
 
+        actor = bpy.data.objects[actor_name]
+        if location is not None:
+            actor.location = location
+        if rotation is not None:
+            actor.rotation_euler = [math.radians(r) for r in rotation]  # convert to radians
+        if scale is not None:
+            actor.scale = scale
+        if stencil_value is not None:
+            XRFeitoriaBlenderFactory.set_pass_index(actor, stencil_value)
+
+    @staticmethod
+    def _import_actors_from_files_in_engine(
+        file_paths: 'List[str]', stencil_value: int = 1, instance: bool = False
+    ) -> 'List[str]':
+        """Import actors from files.
+
+        Args:
+            file_paths (List[str]): File paths of the actors. Support: fbx | obj | alembic | ply | stl.
+            stencil_value (int in [0, 255], optional): Pass index (stencil value) of the actors. Defaults to 1.
+            instance (bool, optional): Whether to create linked duplicates for files listed more than once,
+                instead of importing them again. Defaults to False.
+
+        Returns:
+            List[str]: Names of the imported actors.
+        """
+        names = []
+        imported = {}  # file path -> name of the first actor imported from it
+        for file_path in file_paths:
+            actor_name = ObjectUtilsBlender._generate_obj_name_in_engine('actor')
+            if instance and file_path in imported:
+                _, collection = XRFeitoriaBlenderFactory.get_scene_and_collection_for_new_object()
+                _instance_object_hierarchy(bpy.data.objects[imported[file_path]], actor_name, collection)
+            else:
+                ActorBlender._import_actor_from_file_in_engine(file_path=file_path, actor_name=actor_name)
+                imported[file_path] = actor_name
+            ActorBlender._set_stencil_value_in_engine(actor_name=actor_name, value=stencil_value)
+            names.append(actor_name)
+        return names
+
     @staticmethod
     def _import_animation_from_file_in_engine(animation_path: str, actor_name: str, action_name: str = None) -> None:
         """Import an animation file.
@@ -120,17 +377,15 @@ class ActorBlender(ActorBase):
         Raises:
             TypeError: If 'animation_path' is not `json | blend | fbx` file.
         """
-        anim_file_ext = Path(animation_path).suffix
-        if anim_file_ext.lower() == '.json':
-            XRFeitoriaBlenderFactory.import_mo_json(mo_json_file=animation_path, actor_name=actor_name)
-        elif anim_file_ext.lower() == '.blend':
-            XRFeitoriaBlenderFactory.import_mo_blend(
-                mo_blend_file=animation_path, actor_name=actor_name, action_name=action_name
-            )
-        elif anim_file_ext.lower() == '.fbx':
-            XRFeitoriaBlenderFactory.import_mo_fbx(mo_fbx_file=animation_path, actor_name=actor_name)
-        else:
+        anim_file_ext = os.path.splitext(animation_path)[1].lower()
+        importer = _ANIM_IMPORTERS.get(anim_file_ext)
+        if importer is None:
             raise TypeError(f"Invalid anim file, expected 'json', 'blend', or 'fbx' (got {anim_file_ext[1:]} instead).")
+        method_name, path_arg = importer
+        kwargs = {path_arg: animation_path, 'actor_name': actor_name}
+        if anim_file_ext == '.blend':
+            kwargs['action_name'] = action_name
+        getattr(XRFeitoriaBlenderFactory, method_name)(**kwargs)
 
     @staticmethod
     def _set_material_in_engine(actor_name: str, mat_name: str) -> None:
@@ -429,21 +684,42 @@ class ShapeBlenderWrapper:
         if name is None:
             name = cls._object_utils.generate_obj_name(obj_type=type)
         cls._object_utils.validate_new_name(name)
-        Validator.validate_vector(location, 3)
-        Validator.validate_vector(rotation, 3)
-        Validator.validate_vector(scale, 3)
+        Validator.validate_vectors([location, rotation, scale], 3)
 
-        cls._object_utils.validate_new_name(name)
         cls._spawn_shape_in_engine(
             name=name,
             type=type,
+            location=location,
+            rotation=rotation,
+            scale=scale,
+            stencil_value=stencil_value,
             **kwargs,
         )
-        mesh = ActorBlender(name=name)
-        mesh.set_transform(location, rotation, scale)
-        mesh.stencil_value = stencil_value
         logger.info(f'[cyan]Spawned[/cyan] {type} "{name}"')
-        return mesh
+        return ActorBlender(name=name)
+
+    @classmethod
+    def spawn_many(cls, specs: List[Dict]) -> List['ActorBlender']:
+        """Spawn multiple shapes in the scene with a single RPC call.
+
+        Args:
+            specs (List[Dict]): Keyword arguments of :meth:`spawn` for each shape,
+                e.g. ``{'type': 'cube', 'location': (0, 0, 1), 'size': 2.0}``.
+                Names that are not given are generated in the engine in the same way as :meth:`spawn`.
+
+        Returns:
+            List[ActorBlender]: New added shapes, in the same order as ``specs``.
+        """
+        specs = [dict(spec) for spec in specs]
+        cls._object_utils.validate_new_names([spec['name'] for spec in specs if spec.get('name') is not None])
+        for spec in specs:
+            Validator.validate_vectors(
+                [spec.get('location', (0, 0, 0)), spec.get('rotation', (0, 0, 0)), spec.get('scale', (1, 1, 1))], 3
+            )
+        names = cls._spawn_shapes_in_engine(specs)
+        for spec, name in zip(specs, names):
+            logger.info(f'[cyan]Spawned[/cyan] {spec["type"]} "{name}"')
+        return [ActorBlender(name=name) for name in names]
 
     #####################################
     ###### RPC METHODS (Private) ########
@@ -463,6 +739,10 @@ class ShapeBlenderWrapper:
         depth: float = 2.0,
         radius1: float = 0.0,
         radius2: float = 2.0,
+        location: 'Optional[Vector]' = None,
+        rotation: 'Optional[Vector]' = None,
+        scale: 'Optional[Vector]' = None,
+        stencil_value: 'Optional[int]' = None,
     ) -> None:
         """Spawn a shape in Blender.
 
@@ -478,46 +758,67 @@ class ShapeBlenderWrapper:
             depth (float in [0, inf], optional): Depth. Defaults to 2.0. (unit: meter)
             radius1 (float in [0, inf], optional): Radius1. Defaults to 0.0. (unit: meter)
             radius2 (float in [0, inf], optional): Radius2. Defaults to 2.0. (unit: meter)
+            location (Optional[Vector], optional): Location. Defaults to None, which keeps the default transform.
+            rotation (Optional[Vector], optional): Rotation. Used together with ``location``. Defaults to None.
+            scale (Optional[Vector], optional): Scale. Used together with ``location``. Defaults to None.
+            stencil_value (Optional[int], optional): Pass index (stencil value). Defaults to None.
 
         Raises:
             TypeError: If `mesh_type` is not in Enum ['plane', 'cube', 'UV sphere', 'icosphere', 'cylinder', 'cone']
         """
 
         ## get scene and collection
-        scene, collection = XRFeitoriaBlenderFactory.get_scene_and_collection_for_new_object(collection_name)
+        _, collection = XRFeitoriaBlenderFactory.get_scene_and_collection_for_new_object(collection_name)
 
-        # spawn mesh
-        with XRFeitoriaBlenderFactory.__judge__(name, scene=scene):
-            if type == 'plane':
-                bpy.ops.mesh.primitive_plane_add(size=size)
-            elif type == 'cube':
-                bpy.ops.mesh.primitive_cube_add(size=size)
-            elif type == 'sphere':
-                bpy.ops.mesh.primitive_uv_sphere_add(
-                    segments=segments,
-                    ring_count=ring_count,
-                    radius=radius,
-                )
-            elif type == 'ico_sphere':
-                bpy.ops.mesh.primitive_ico_sphere_add(
-                    subdivisions=subdivisions,
-                    radius=radius,
-                )
-            elif type == 'cylinder':
-                bpy.ops.mesh.primitive_cylinder_add(
-                    vertices=vertices,
-                    radius=radius,
-                    depth=depth,
-                )
-            elif type == 'cone':
-                bpy.ops.mesh.primitive_cone_add(
-                    vertices=vertices,
-                    radius1=radius1,
-                    radius2=radius2,
-                    depth=depth,
-                )
-            else:
-                raise TypeError(
-                    f'Unsupported mesh type, expected "plane", "cube", "sphere", '
-                    f'"ico_sphere", "cylinder" or "cone", (got "{type}" instead).'
-                )
+        _new_shape_object(
+            collection,
+            name=name,
+            type=type,
+            location=location,
+            rotation=rotation,
+            scale=scale,
+            stencil_value=stencil_value,
+            size=size,
+            segments=segments,
+            ring_count=ring_count,
+            radius=radius,
+            subdivisions=subdivisions,
+            vertices=vertices,
+            depth=depth,
+            radius1=radius1,
+            radius2=radius2,
+        )
+
+    @staticmethod
+    def _spawn_shapes_in_engine(specs: 'List[Dict]', collection_name: str = None) -> 'List[str]':
+        """Spawn shapes in Blender and return their names.
+
+        Args:
+            specs (List[Dict]): Keyword arguments of ``ShapeBlenderWrapper.spawn`` for each shape.
+            collection_name (str, optional): Name of the collection to add the shapes to.
+
+        Returns:
+            List[str]: Names of the new added shapes.
+        """
+        # resolve the scene and collection once for all the shapes
+        _, collection = XRFeitoriaBlenderFactory.get_scene_and_collection_for_new_object(collection_name)
+
+        names = []
+        templates = {}  # meshes built in this call, copied for shapes with the same type and parameters
+        for spec in specs:
+            spec = spec.copy()
+            name = spec.pop('name', None) or ObjectUtilsBlender._generate_obj_name_in_engine(spec['type'])
+            _new_shape_object(
+                collection,
+                templates=templates,
+                name=name,
+                location=spec.pop('location', (0, 0, 0)),
+                rotation=spec.pop('rotation', (0, 0, 0)),
+                scale=spec.pop('scale', (1, 1, 1)),
+                stencil_value=spec.pop('stencil_value', 1),
+                **spec,
+            )
+            names.append(name)
+        # the objects are created with the data API without evaluating the depsgraph, evaluate it once for all of them
+        bpy.context.view_layer.update()
+        return names
@@ -1,4 +1,4 @@
-from typing import Literal, Optional
+from typing import Dict, List, Literal, Optional, Tuple
 
 from loguru import logger
 
@@ -6,7 +6,6 @@ from ..data_structure.constants import ShapeTypeEnumUnreal, Vector
 from ..object.object_utils import ObjectUtilsUnreal
 from ..rpc import remote_unreal
 from ..utils import Validator
-from ..utils.functions import unreal_functions
 from .actor_base import ActorBase
 
 try:
@@ -15,11 +14,26 @@ try:
 except ModuleNotFoundError:
     pass
 
+# assets of the basic shapes loaded in the engine, by engine path
+_shape_assets: 'Dict[str, unreal.Object]' = {}
+
+
+def _load_shape_asset(engine_path: str) -> 'unreal.Object':
+    """Load the asset of a basic shape, which is cached since the engine content does
+    not change. Only works in Unreal."""
+    if engine_path not in _shape_assets:
+        _object = unreal.load_asset(engine_path)
+        if _object is None:
+            raise ValueError(f'Asset `{engine_path}` does not exist')
+        _shape_assets[engine_path] = _object
+    return _shape_assets[engine_path]
+
 
 @remote_unreal(dec_class=True, suffix='_in_engine')
 class ActorUnreal(ActorBase):
     """Actor class for Unreal Engine."""
 
+    __slots__ = ()
     _object_utils = ObjectUtilsUnreal
 
     @property
@@ -52,9 +66,7 @@ class ActorUnreal(ActorBase):
         if name is None:
             name = cls._object_utils.generate_obj_name(obj_type='actor')
         cls._object_utils.validate_new_name(name)
-        Validator.validate_vector(location, 3)
-        Validator.validate_vector(rotation, 3)
-        Validator.validate_vector(scale, 3)
+        Validator.validate_vectors([location, rotation, scale], 3)
 
         _name = cls._spawn_actor_in_engine(engine_path, name=name, location=location, rotation=rotation, scale=scale)
         logger.info(f'[cyan]Spawned[/cyan] actor "{_name}"')
@@ -89,6 +101,30 @@ class ActorUnreal(ActorBase):
         actor = XRFeitoriaUnrealFactory.utils_actor.get_actor_by_name(actor_name)
         return XRFeitoriaUnrealFactory.utils_actor.get_actor_mask_color(actor)
 
+    @staticmethod
+    def _get_stencil_values_in_engine(actor_names: 'List[str]') -> 'List[int]':
+        """Get stencil values of the actors in Unreal Engine.
+
+        Args:
+            actor_names (List[str]): Names of the actors.
+
+        Returns:
+            List[int]: Stencil values.
+        """
+        return [ActorUnreal._get_stencil_value_in_engine(actor_name) for actor_name in actor_names]
+
+    @staticmethod
+    def _get_mask_colors_in_engine(actor_names: 'List[str]') -> 'List[Vector]':
+        """Get mask colors of the actors in Unreal Engine.
+
+        Args:
+            actor_names (List[str]): Names of the actors.
+
+        Returns:
+            List[Vector]: Mask colors. (r, g, b) in [0, 255].
+        """
+        return [ActorUnreal._get_mask_color_in_engine(actor_name) for actor_name in actor_names]
+
     @staticmethod
     def _set_stencil_value_in_engine(actor_name: str, value: int) -> int:
         """Set pass index of the actor in Unreal Engine.
@@ -100,6 +136,16 @@ class ActorUnreal(ActorBase):
         actor = XRFeitoriaUnrealFactory.utils_actor.get_actor_by_name(actor_name)
         XRFeitoriaUnrealFactory.utils_actor.set_stencil_value(actor, value)
 
+    @staticmethod
+    def _set_stencil_values_in_engine(stencil_values: 'Dict[str, int]') -> None:
+        """Set pass indexes of the actors in Unreal Engine.
+
+        Args:
+            stencil_values (Dict[str, int]): Mapping from actor names to pass indexes (stencil values).
+        """
+        for actor_name, value in stencil_values.items():
+            ActorUnreal._set_stencil_value_in_engine(actor_name, value)
+
     @staticmethod
     def _import_actor_from_file_in_engine(file_path: str, actor_name: str) -> None:
         """Imports an actor from a file in the Unreal Engine and spawns it in the world
@@ -141,8 +187,10 @@ class ActorUnreal(ActorBase):
         Returns:
             str: the name of the actor that was spawned
         """
-        unreal_functions.check_asset_in_engine(engine_path, raise_error=True)
+        # a missing asset loads as None, so there is no need to query the asset registry beforehand
         _object = unreal.load_asset(engine_path)
+        if _object is None:
+            raise ValueError(f'Asset `{engine_path}` does not exist')
         # location = [loc * 100.0 for loc in location]  # convert from meters to centimeters
         _actor = XRFeitoriaUnrealFactory.utils_actor.spawn_actor_from_object(_object, location, rotation, scale)
         _actor.set_actor_label(name)
@@ -201,11 +249,148 @@ class ShapeUnrealWrapper:
         """
         if name is None:
             name = cls._object_utils.generate_obj_name(obj_type=type)
+        cls._object_utils.validate_new_name(name)
+        Validator.validate_vectors([location, rotation, scale], 3)
 
-        return ActorUnreal.spawn_from_engine_path(
-            engine_path=cls.path_mapping[type],
-            name=name,
-            location=location,
-            rotation=rotation,
-            scale=scale,
+        _name = cls._spawn_shape_in_engine(
+            cls.path_mapping[type], name=name, location=location, rotation=rotation, scale=scale
         )
+        logger.info(f'[cyan]Spawned[/cyan] {type} "{_name}"')
+        return ActorUnreal(_name)
+
+    @classmethod
+    def spawn_many(cls, types: List[Literal['cube', 'sphere', 'cylinder', 'cone', 'plane']]) -> List['ActorUnreal']:
+        """Spawns multiple shapes in the engine with a single RPC call and returns their
+        corresponding actors.
+
+        Names are generated in the engine in the same way as :meth:`spawn`, and all
+        shapes are spawned at the origin with default rotation and scale.
+
+        Args:
+            types (List[Literal['cube', 'sphere', 'cylinder', 'cone', 'plane']]): the types of the shapes.
+
+        Returns:
+            List[ActorUnreal]: the actors that were spawned, in the same order as ``types``.
+        """
+        engine_paths = [cls.path_mapping[_type] for _type in types]
+        names = cls._spawn_shapes_in_engine(list(types), engine_paths)
+        for _type, name in zip(types, names):
+            logger.info(f'[cyan]Spawned[/cyan] {_type} "{name}"')
+        return [ActorUnreal(name) for name in names]
+
+    @classmethod
+    def spawn_batch(
+        cls,
+        type: Literal['cube', 'sphere', 'cylinder', 'cone', 'plane'],
+        transforms: 'List[Tuple[Vector, Vector, Vector]]',
+        names: Optional[List[str]] = None,
+    ) -> List['ActorUnreal']:
+        """Spawns multiple shapes of the same type with a single RPC call and returns
+        their corresponding actors.
+
+        Args:
+            type (Literal['cube', 'sphere', 'cylinder', 'cone', 'plane']): the type of the shapes.
+            transforms (List[Tuple[Vector, Vector, Vector]]): (location, rotation, scale) of each shape.
+                Units are in meters and degrees.
+            names (Optional[List[str]], optional): the names of the shapes. Defaults to None,
+                in which case the names are generated in the engine in the same way as :meth:`spawn`.
+
+        Returns:
+            List[ActorUnreal]: the actors that were spawned, in the same order as ``transforms``.
+        """
+        transforms = [list(transform) for transform in transforms]
+        for transform in transforms:
+            Validator.validate_vectors(transform, 3)
+        if names is not None:
+            if len(names) != len(transforms):
+                raise ValueError(f'Got {len(names)} names for {len(transforms)} transforms.')
+            cls._object_utils.validate_new_names(names)
+
+        types = [type] * len(transforms)
+        names = cls._spawn_shapes_in_engine(types, [cls.path_mapping[type]] * len(transforms), transforms, names)
+        for name in names:
+            logger.info(f'[cyan]Spawned[/cyan] {type} "{name}"')
+        return [ActorUnreal(name) for name in names]
+
+    @classmethod
+    def delete_many(cls, actors: List['ActorUnreal']) -> None:
+        """Deletes multiple actors from the engine with a single RPC call.
+
+        Args:
+            actors (List[ActorUnreal]): the actors to delete.
+        """
+        names = [actor.name for actor in actors]
+        cls._delete_actors_in_engine(names)
+        for name in names:
+            logger.info(f'[red]Deleted[/red] object "{name}"')
+
+    #####################################
+    ###### RPC METHODS (Private) ########
+    #####################################
+
+    @staticmethod
+    def _spawn_shape_in_engine(
+        engine_path: str,
+        name: str,
+        location: 'Vector' = (0, 0, 0),
+        rotation: 'Vector' = (0, 0, 0),
+        scale: 'Vector' = (1, 1, 1),
+    ) -> str:
+        """Spawns a basic shape in the engine and returns its name.
+
+        Args:
+            engine_path (str): the path to the shape in the engine. For example, '/Engine/BasicShapes/Cube'.
+            name (str): the name of the actor.
+            location (Vector, optional): the location of the actor. Units are in meters. Defaults to (0, 0, 0).
+            rotation (Vector, optional): the rotation of the actor. Units are in degrees. Defaults to (0, 0, 0).
+            scale (Vector, optional): the scale of the actor. Defaults to (1, 1, 1).
+
+        Returns:
+            str: the name of the actor that was spawned
+        """
+        _object = _load_shape_asset(engine_path)
+        _actor = XRFeitoriaUnrealFactory.utils_actor.spawn_actor_from_object(_object, location, rotation, scale)
+        _actor.set_actor_label(name)
+        return _actor.get_actor_label()
+
+    @staticmethod
+    def _spawn_shapes_in_engine(
+        types: 'List[str]',
+        engine_paths: 'List[str]',
+        transforms: 'Optional[List[List[Vector]]]' = None,
+        names: 'Optional[List[str]]' = None,
+    ) -> 'List[str]':
+        """Spawns shapes in the engine and returns their names.
+
+        Args:
+            types (List[str]): the types of the shapes, used to generate the names.
+            engine_paths (List[str]): the paths to the shapes in the engine.
+            transforms (Optional[List[List[Vector]]], optional): (location, rotation, scale) of each shape.
+                Defaults to None, in which case the shapes are spawned at the origin.
+            names (Optional[List[str]], optional): the names of the shapes. Defaults to None,
+                in which case the names are generated.
+
+        Returns:
+            List[str]: the names of the actors that were spawned
+        """
+        spawned_names = []
+        for idx, (_type, engine_path) in enumerate(zip(types, engine_paths)):
+            name = names[idx] if names else ObjectUtilsUnreal._generate_obj_name_in_engine(_type)
+            location, rotation, scale = transforms[idx] if transforms else ((0, 0, 0), (0, 0, 0), (1, 1, 1))
+            spawned_names.append(
+                ShapeUnrealWrapper._spawn_shape_in_engine(
+                    engine_path, name, location=location, rotation=rotation, scale=scale
+                )
+            )
+        return spawned_names
+
+    @staticmethod
+    def _delete_actors_in_engine(names: 'List[str]') -> None:
+        """Deletes actors in the engine.
+
+        Args:
+            names (List[str]): the names of the actors.
+        """
+        for name in names:
+            actor = XRFeitoriaUnrealFactory.utils_actor.get_actor_by_name(name)
+            XRFeitoriaUnrealFactory.utils_actor.destroy_actor(actor)
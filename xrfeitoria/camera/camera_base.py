@@ -13,6 +13,7 @@ from ..utils import Validator
 class CameraBase(ABC, ObjectBase):
     """Base camera class."""
 
+    __slots__ = ()
     _object_utils = ObjectUtilsBase
 
     @classmethod
@@ -40,9 +41,8 @@ class CameraBase(ABC, ObjectBase):
         if camera_name is None:
             camera_name = cls._object_utils.generate_obj_name(obj_type='camera')
         cls._object_utils.validate_new_name(camera_name)
-        Validator.validate_vector(location, 3)
-        Validator.validate_vector(rotation, 3)
-        Validator.validate_argument_type(fov, [float, int])
+        Validator.validate_vectors([location, rotation], 3)
+        Validator.validate_argument_type(fov, (float, int))
         cls._spawn_in_engine(camera_name=camera_name, location=location, rotation=rotation, fov=fov)
         logger.info(f'[cyan]Spawned[/cyan] camera "{camera_name}"')
         return cls(camera_name)
@@ -54,7 +54,7 @@ class CameraBase(ABC, ObjectBase):
 
     @fov.setter
     def fov(self, value):
-        Validator.validate_argument_type(value, [float, int])
+        Validator.validate_argument_type(value, (float, int))
         self._set_camera_fov_in_engine(self._name, value)
 
     def get_KRT(self) -> Tuple[List, List, Vector]:
@@ -14,7 +14,7 @@ except ModuleNotFoundError:
     pass
 
 try:
-    from ..data_structure.models import TransformKeys  # isort:skip
+    from ..data_structure.models import SequenceTransformKey, TransformKeys  # isort:skip
 except (ImportError, ModuleNotFoundError):
     pass
 
@@ -23,6 +23,7 @@ except (ImportError, ModuleNotFoundError):
 class CameraBlender(CameraBase):
     """Camera class for Blender."""
 
+    __slots__ = ()
     _object_utils = ObjectUtilsBlender
 
     @property
@@ -44,10 +45,20 @@ class CameraBlender(CameraBase):
         Args:
             transform_keys (List[Dict]): Keyframes of transform (frame, location, rotation, scale, and interpolation).
         """
-        if not isinstance(transform_keys, list):
-            transform_keys = [transform_keys]
-        transform_keys = [i.model_dump() for i in transform_keys]
-        self._object_utils.set_transform_keys(name=self.name, transform_keys=transform_keys)
+        self._object_utils.set_transform_keys(name=self.name, transform_keys=SequenceTransformKey.pack(transform_keys))
+
+    @classmethod
+    def get_KRT_batch(cls, names: List[str]) -> Tuple[List, List, List]:
+        """Get the intrinsic and extrinsic parameters of many cameras in a single RPC
+        call.
+
+        Args:
+            names (List[str]): names of the cameras.
+
+        Returns:
+            Tuple[List, List, List]: K (Nx3x3), R (Nx3x3), T (Nx3), in the order of ``names``.
+        """
+        return cls._get_KRT_batch_in_engine(names)
 
     #####################################
     ###### RPC METHODS (Private) ########
@@ -98,6 +109,25 @@ class CameraBlender(CameraBase):
         K, R, T = XRFeitoriaBlenderFactory.get_camera_KRT_from_blender(camera)
         return K.tolist(), R.tolist(), T.tolist()
 
+    @staticmethod
+    def _get_KRT_batch_in_engine(names: 'List[str]') -> 'Tuple[List, List, List]':
+        """Get many cameras' intrinsic and extrinsic parameters from blender.
+
+        Args:
+            names (List[str]): names of the cameras.
+
+        Returns:
+            Tuple[List, List, List]: K (Nx3x3), R (Nx3x3), T (Nx3)
+        """
+        import numpy as np
+
+        K = np.empty((len(names), 3, 3))
+        R = np.empty((len(names), 3, 3))
+        T = np.empty((len(names), 3))
+        for idx, name in enumerate(names):
+            K[idx], R[idx], T[idx] = XRFeitoriaBlenderFactory.get_camera_KRT_from_blender(bpy.data.objects[name])
+        return K.tolist(), R.tolist(), T.tolist()
+
     ######   Setter   ######
 
     @staticmethod
@@ -133,7 +163,7 @@ class CameraBlender(CameraBase):
 
         ## set camera location and rotation
         camera.location = location
-        camera.rotation_euler = tuple(math.radians(r) for r in rotation)
+        camera.rotation_euler = tuple(map(math.radians, rotation))
 
         ## get scene and collection
         scene, collection = XRFeitoriaBlenderFactory.get_scene_and_collection_for_new_object(collection_name)
@@ -1,5 +1,3 @@
-import copy
-import math
 from typing import List, Tuple, Union
 
 import numpy as np
@@ -69,9 +67,9 @@ class CameraParameter(PinholeCameraParameter):
             CameraParameter
         """
         new_cam_param = self.__class__(
-            K=copy.deepcopy(self.get_intrinsic(k_dim=4)),
-            R=copy.deepcopy(self.extrinsic_r),
-            T=copy.deepcopy(self.extrinsic_t),
+            K=np.array(self.get_intrinsic(k_dim=4)),
+            R=self.extrinsic_r.copy(),
+            T=self.extrinsic_t.copy(),
             world2cam=self.world2cam,
             convention=self.convention,
         )
@@ -93,7 +91,10 @@ class CameraParameter(PinholeCameraParameter):
         Returns:
             ndarray: An ndarray of float32, 3x4 RT mat.
         """
-        return np.concatenate([self.extrinsic_r, self.extrinsic_t.reshape(3, 1)], axis=1)
+        extrinsic = np.empty((3, 4), dtype=np.result_type(self.extrinsic_r, self.extrinsic_t))
+        extrinsic[:, :3] = self.extrinsic_r
+        extrinsic[:, 3] = self.extrinsic_t
+        return extrinsic
 
     def get_projection_matrix(self) -> List:
         """Get the camera matrix of ``K@RT``.
@@ -168,14 +169,37 @@ class CameraParameter(PinholeCameraParameter):
             CameraParameter: An instance of CameraParameter class.
         """
         # read camera parameters
-        with open(file, 'rb') as f:
-            dat = np.frombuffer(f.read(), np.float32).reshape(9)
+        dat = np.fromfile(str(file), dtype=np.float32, count=9)
         location = dat[:3]
         rotation = dat[3:6]
         camera_fov = dat[6]
         image_size = (dat[7], dat[8])  # (width, height)
         return cls.from_unreal_convention(location, rotation, camera_fov, image_size)
 
+    @classmethod
+    def from_bin_batch(cls, files: List[PathLike]) -> List['CameraParameter']:
+        """Construct camera parameter data structures from binary files in one
+        vectorized pass.
+
+        Args:
+            files (List[PathLike]): Paths to the dumped binary files.
+
+        Returns:
+            List[CameraParameter]: Instances of CameraParameter class, in the order of ``files``.
+        """
+        if len(files) == 0:
+            return []
+        # read camera parameters, of shape (N, 9)
+        dat = np.empty((len(files), 9), dtype=np.float32)
+        for idx, file in enumerate(files):
+            dat[idx] = np.fromfile(str(file), dtype=np.float32, count=9)
+        return cls.from_unreal_convention_batch(
+            locations=dat[:, :3],
+            rotations=dat[:, 3:6],
+            fovs=dat[:, 6],
+            image_sizes=dat[:, 7:9],  # (width, height)
+        )
+
     @classmethod
     def from_unreal_convention(
         cls,
@@ -196,26 +220,53 @@ class CameraParameter(PinholeCameraParameter):
         Returns:
             CameraParameter: The converted camera parameters.
         """
-        # intrinsic matrix K
-        fov = math.radians(fov)
-        focal = max(image_size) / 2 / math.tan(fov / 2)
-        fx = fy = focal
-        K = np.array(
-            [
-                [fx, 0, image_size[0] / 2],
-                [0, fy, image_size[1] / 2],
-                [0, 0, 1],
-            ]
-        )
+        # K is filled into a preallocated array by the batched path
+        return cls.from_unreal_convention_batch(
+            locations=[location], rotations=[rotation], fovs=[fov], image_sizes=image_size
+        )[0]
 
-        # extrinsic matrix RT
-        R = ConverterUnreal.rotation_camera_from_ue(rotation, degrees=True)
-        _T = ConverterUnreal.location_from_ue(location)
-        T = -R @ _T
+    @classmethod
+    def from_unreal_convention_batch(
+        cls,
+        locations: np.ndarray,
+        rotations: np.ndarray,
+        fovs: np.ndarray,
+        image_sizes: np.ndarray,
+    ) -> List['CameraParameter']:
+        """Converts a batch of camera parameters from Unreal Engine convention to
+        CameraParameter objects, computing all K, R, T with broadcasting.
 
-        # construct camera parameter
-        cam_param = cls(K=K, R=R, T=T, world2cam=True)
-        return cam_param
+        Args:
+            locations (np.ndarray): The camera locations in Unreal Engine convention, of shape (N, 3).
+            rotations (np.ndarray): The camera rotations in Unreal Engine convention, of shape (N, 3).
+            fovs (np.ndarray): The camera field of views in degrees, of shape (N,).
+            image_sizes (np.ndarray): The sizes of the camera images in pixels (width, height), of shape (N, 2) or (2,).
+
+        Returns:
+            List[CameraParameter]: The converted camera parameters.
+        """
+        locations = np.asarray(locations, dtype=np.float64).reshape(-1, 3)
+        rotations = np.asarray(rotations, dtype=np.float64).reshape(-1, 3)
+        fovs = np.asarray(fovs, dtype=np.float64).reshape(-1)
+        num = fovs.shape[0]
+        image_sizes = np.broadcast_to(np.asarray(image_sizes, dtype=np.float64).reshape(-1, 2), (num, 2))
+
+        # intrinsic matrices K, of shape (N, 3, 3)
+        focal = image_sizes.max(axis=1) / 2 / np.tan(np.radians(fovs) / 2)
+        K = np.zeros((num, 3, 3))
+        K[:, 0, 0] = focal
+        K[:, 1, 1] = focal
+        K[:, 0, 2] = image_sizes[:, 0] / 2
+        K[:, 1, 2] = image_sizes[:, 1] / 2
+        K[:, 2, 2] = 1
+
+        # extrinsic matrices RT, of shape (N, 3, 3) and (N, 3)
+        R = ConverterUnreal.rotation_camera_from_ue(rotations, degrees=True)
+        _T = ConverterUnreal.location_from_ue(locations)
+        T = -np.einsum('nij,nj->ni', R, _T)
+
+        # construct camera parameters
+        return [cls(K=K[idx], R=R[idx], T=T[idx], world2cam=True) for idx in range(num)]
 
     @classmethod
     def _from_pinhole(cls, pinhole: PinholeCameraParameter) -> 'CameraParameter':
@@ -1,3 +1,5 @@
+from typing import Dict
+
 from ..data_structure.constants import Vector
 from ..object.object_utils import ObjectUtilsUnreal
 from ..rpc import remote_unreal
@@ -10,11 +12,26 @@ try:
 except ModuleNotFoundError:
     pass
 
+# camera actors resolved in the engine, by actor label
+_camera_actors: 'Dict[str, unreal.CameraActor]' = {}
+
+
+def _get_camera_actor(name: str) -> 'unreal.CameraActor':
+    """Get the camera actor by its label, which is cached to avoid walking all actors
+    of the level on every call. The actor is resolved again once the cached one is
+    destroyed or renamed. Only works in Unreal."""
+    camera = _camera_actors.get(name)
+    if camera is None or not unreal.SystemLibrary.is_valid(camera) or camera.get_actor_label() != name:
+        camera = XRFeitoriaUnrealFactory.utils_actor.get_actor_by_name(name)
+        _camera_actors[name] = camera
+    return camera
+
 
 @remote_unreal(dec_class=True, suffix='_in_engine')
 class CameraUnreal(CameraBase):
     """Camera class for Unreal."""
 
+    __slots__ = ()
     _object_utils = ObjectUtilsUnreal
 
     @property
@@ -24,7 +41,7 @@ class CameraUnreal(CameraBase):
 
     @aspect_ratio.setter
     def aspect_ratio(self, value: float):
-        Validator.validate_argument_type(value, [float, int])
+        Validator.validate_argument_type(value, (float, int))
         self._set_aspect_ratio_in_engine(self._name, value)
 
     def look_at(self, target: Vector) -> None:
@@ -33,7 +50,7 @@ class CameraUnreal(CameraBase):
         Args:
             target (Vector): [x, y, z] coordinates of the target, in units of meters.
         """
-        target = [x * 100.0 for x in target]  # convert to cm
+        target = (target[0] * 100.0, target[1] * 100.0, target[2] * 100.0)  # convert to cm
         super().look_at(target)
 
     # ----- Getter ----- #
@@ -44,12 +61,12 @@ class CameraUnreal(CameraBase):
 
     @staticmethod
     def _get_fov_in_engine(name):
-        camera: unreal.CameraActor = XRFeitoriaUnrealFactory.utils_actor.get_actor_by_name(name)
+        camera = _get_camera_actor(name)
         return camera.camera_component.field_of_view
 
     @staticmethod
     def _get_aspect_ratio_in_engine(name: str) -> float:
-        camera: unreal.CameraActor = XRFeitoriaUnrealFactory.utils_actor.get_actor_by_name(name)
+        camera = _get_camera_actor(name)
         return camera.camera_component.aspect_ratio
 
     # ----- Setter ----- #
@@ -60,12 +77,12 @@ class CameraUnreal(CameraBase):
 
     @staticmethod
     def _set_camera_fov_in_engine(name, fov):
-        camera: unreal.CameraActor = XRFeitoriaUnrealFactory.utils_actor.get_actor_by_name(name)
+        camera = _get_camera_actor(name)
         camera.camera_component.field_of_view = fov
 
     @staticmethod
     def _set_aspect_ratio_in_engine(name: str, ratio: float):
-        camera: unreal.CameraActor = XRFeitoriaUnrealFactory.utils_actor.get_actor_by_name(name)
+        camera = _get_camera_actor(name)
         camera.camera_component.aspect_ratio = ratio
 
     @staticmethod
@@ -80,11 +97,12 @@ class CameraUnreal(CameraBase):
         )
         camera.camera_component.field_of_view = fov
         camera.set_actor_label(camera_name)
+        _camera_actors[camera.get_actor_label()] = camera
         return camera.get_actor_label()
 
     @staticmethod
     def _look_at_in_engine(name, target: 'Vector'):
-        camera: unreal.CameraActor = XRFeitoriaUnrealFactory.utils_actor.get_actor_by_name(name)
+        camera = _get_camera_actor(name)
         location = camera.get_actor_location()
         target = unreal.Vector(x=target[0], y=target[1], z=target[2])
 
@@ -153,6 +153,7 @@ def main(
 
     seq_name = mesh_path.stem
     camera_name = 'camera'
+    render_samples = RENDER_SAMPLES[render_quality]
 
     with xf.init_blender(exec_path=blender_exec, background=background) as xf_runner:
         with xf_runner.Sequence.new(seq_name=seq_name) as seq:
@@ -195,7 +196,7 @@ def main(
                 resolution=resolution,
                 render_passes=[RenderPass(render_pass, img_format) for render_pass in render_passes],
                 render_engine=render_engine,
-                render_samples=RENDER_SAMPLES[render_quality],
+                render_samples=render_samples,
                 transparent_background=transparent,
                 arrange_file_structure=True,
             )
@@ -47,8 +47,9 @@ def add_smplx(betas: 'Tuple[float, ...]' = (0.0,) * 10, gender: str = 'neutral')
     bpy.ops.object.smplx_set_texture()
 
     smplx_mesh = bpy.context.selected_objects[0]
+    key_blocks = smplx_mesh.data.shape_keys.key_blocks
     for index, beta in enumerate(betas):
-        smplx_mesh.data.shape_keys.key_blocks[f'Shape{index:03d}'].value = beta
+        key_blocks[f'Shape{index:03d}'].value = beta
     bpy.ops.object.smplx_update_joint_locations()
     bpy.ops.object.smplx_set_handpose()
 
@@ -73,9 +74,7 @@ def export_fbx(
     save_path = Path(save_path).resolve()
     bpy.ops.object.mode_set(mode='OBJECT')
     # re-select the armature
-    # bpy.ops.object.select_all(action='DESELECT')
-    for obj in bpy.data.objects:
-        obj.select_set(False)
+    bpy.ops.object.select_all(action='DESELECT')
     bpy.context.view_layer.objects.active = target_rig
     if with_mesh:
         # select the mesh for export
@@ -110,20 +109,21 @@ def read_smpl_x(path: Path) -> 'Motion':
     Returns:
         SMPLXMotion: The motion.
     """
-    smpl_x_data = np.load(path, allow_pickle=True)
-    if 'smplx' in smpl_x_data:
-        smpl_x_data = smpl_x_data['smplx'].item()
-        motion = SMPLXMotion.from_smplx_data(smpl_x_data)
-    if 'smpl' in smpl_x_data:
-        smpl_x_data = smpl_x_data['smpl'].item()
-        motion = SMPLMotion.from_smpl_data(smpl_x_data)
-    if 'pose_body' in smpl_x_data:
-        motion = SMPLXMotion.from_amass_data(smpl_x_data, insert_rest_pose=False)
-    else:
-        try:
-            motion = SMPLXMotion.from_smplx_data(smpl_x_data)
-        except Exception:
-            raise ValueError(f'Unknown data format of {path}, got {smpl_x_data.keys()}, but expected "smpl" or "smplx"')
+    # `.npz` archives are read lazily, only the matched key is decompressed
+    with np.load(path, allow_pickle=True) as smpl_x_data:
+        if 'smplx' in smpl_x_data:
+            motion = SMPLXMotion.from_smplx_data(smpl_x_data['smplx'].item())
+        elif 'smpl' in smpl_x_data:
+            motion = SMPLMotion.from_smpl_data(smpl_x_data['smpl'].item())
+        elif 'pose_body' in smpl_x_data:
+            motion = SMPLXMotion.from_amass_data(smpl_x_data, insert_rest_pose=False)
+        else:
+            try:
+                motion = SMPLXMotion.from_smplx_data(smpl_x_data)
+            except Exception:
+                raise ValueError(
+                    f'Unknown data format of {path}, got {smpl_x_data.files}, but expected "smpl" or "smplx"'
+                )
     motion.insert_rest_pose()
     return motion
 
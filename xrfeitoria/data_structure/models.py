@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Dict, List, Literal, Optional, Tuple, Union
 
 from pydantic import BaseModel, Field
@@ -188,10 +189,35 @@ class RenderPass(BaseModel):
                 image_format=image_format,
             )
 
+    @classmethod
+    def of(
+        cls,
+        render_layer: Literal['img', 'mask', 'depth', 'flow', 'normal', 'diffuse'],
+        image_format: Literal['png', 'bmp', 'jpg', 'jpeg', 'exr'],
+    ) -> 'RenderPass':
+        """Get a render pass for the given render layer and image format, which is
+        validated only once per engine. Each call returns a new copy of the validated one.
+
+        Args:
+            render_layer (str): Render layer, see :meth:`RenderPass.__init__` for details.
+            image_format (str): Image format, see :meth:`RenderPass.__init__` for details.
+
+        Examples:
+            >>> RenderPass.of('img', 'png')
+        """
+        # copy, so that modifying the returned instance does not affect the cached one
+        return _get_render_pass(_tls.cache.get('platform', None), render_layer, image_format).model_copy()
+
     class Config:
         use_enum_values = True
 
 
+@lru_cache(maxsize=32)
+def _get_render_pass(platform: EngineEnum, render_layer: str, image_format: str) -> RenderPass:
+    # `platform` is part of the cache key, since the render layer is validated against the engine
+    return RenderPass(render_layer, image_format)
+
+
 class RenderJobBlender(BaseModel):
     """Render job model for Blender."""
 
@@ -352,5 +378,30 @@ class SequenceTransformKey(BaseModel):
     class Config:
         use_enum_values = True
 
+    @staticmethod
+    def pack(transform_keys: 'TransformKeys') -> Dict[str, List]:
+        """Pack transform keys into a dict of lists (struct of arrays) to be sent to
+        the engine.
+
+        The fields are read directly from the ``__dict__`` of the keys, which is much
+        cheaper than ``model_dump`` of each key for long keyframe lists.
+
+        Args:
+            transform_keys (TransformKeys): A transform key or a list of transform keys.
+
+        Returns:
+            Dict[str, List]: Lists of frame, location, rotation, scale and interpolation, one item per key.
+        """
+        if not isinstance(transform_keys, list):
+            transform_keys = [transform_keys]
+        fields = [key.__dict__ for key in transform_keys]
+        return {
+            'frame': [field['frame'] for field in fields],
+            'location': [field['location'] for field in fields],
+            'rotation': [field['rotation'] for field in fields],
+            'scale': [field['scale'] for field in fields],
+            'interpolation': [field['interpolation'] for field in fields],
+        }
+
 
 TransformKeys = Union[List[SequenceTransformKey], SequenceTransformKey]
@@ -9,6 +9,7 @@ from .object_utils import ObjectUtilsBase
 class ObjectBase:
     """Base class for all objects in the world."""
 
+    __slots__ = ('_name',)
     _object_utils = ObjectUtilsBase
 
     def __init__(self, name: str) -> None:
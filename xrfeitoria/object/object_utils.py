@@ -1,6 +1,8 @@
 import math
 from abc import ABC, abstractmethod
-from typing import Dict, List, Literal, Tuple
+from typing import Dict, List, Literal, Tuple, Union
+
+import numpy as np
 
 from ..data_structure.constants import Transform, Vector, xf_obj_name
 from ..rpc import remote_blender, remote_unreal
@@ -116,9 +118,7 @@ class ObjectUtilsBase(ABC):
             scale (Vector): Scale of the object.
         """
         cls.validate_name(name)
-        Validator.validate_vector(location, 3)
-        Validator.validate_vector(rotation, 3)
-        Validator.validate_vector(scale, 3)
+        Validator.validate_vectors([location, rotation, scale], 3)
         cls._set_transform_in_engine(name, location, rotation, scale)
 
     @classmethod
@@ -206,6 +206,11 @@ class ObjectUtilsBase(ABC):
     def _get_all_objects_in_engine() -> 'List[str]':
         raise NotImplementedError
 
+    @staticmethod
+    @abstractmethod
+    def _object_exists_in_engine(name: str) -> bool:
+        raise NotImplementedError
+
     @staticmethod
     @abstractmethod
     def _generate_obj_name_in_engine(obj_type: str) -> str:
@@ -252,16 +257,31 @@ class ObjectUtilsBase(ABC):
     # ----- Validator ------ #
     @classmethod
     def validate_name(cls, name):
-        objects = cls._get_all_objects_in_engine()
-        if name not in objects:
+        if not cls._object_exists_in_engine(name):
             raise ValueError(f"Invalid name, '{name}' does not exist in scene.")
 
     @classmethod
     def validate_new_name(cls, name):
-        objects = cls._get_all_objects_in_engine()
-        if name in objects:
+        if cls._object_exists_in_engine(name):
             raise ValueError(f"Invalid name, '{name}' already exists in scene.")
 
+    @classmethod
+    def validate_new_names(cls, names: 'List[str]'):
+        """Validate multiple new names against the objects in the scene with a single
+        RPC call.
+
+        Args:
+            names (List[str]): Names of the new objects.
+
+        Raises:
+            ValueError: If any name already exists in scene, or is given more than once.
+        """
+        objects = set(cls._get_all_objects_in_engine())
+        for name in names:
+            if name in objects:
+                raise ValueError(f"Invalid name, '{name}' already exists in scene.")
+            objects.add(name)
+
 
 @remote_blender(dec_class=True)
 class ObjectUtilsBlender(ObjectUtilsBase):
@@ -271,12 +291,14 @@ class ObjectUtilsBlender(ObjectUtilsBase):
     # ------- Setter ------- #
     ##########################
     @classmethod
-    def set_transform_keys(cls, name: str, transform_keys: 'List[Dict]'):
+    def set_transform_keys(cls, name: str, transform_keys: 'Union[List[Dict], Dict[str, List]]'):
         """Set keyframe of the object.
 
         Args:
             name (str): Name of the object.
-            transform_keys (List[Dict]): Keyframes of transform (frame, location, rotation, scale, and interpolation).
+            transform_keys (Union[List[Dict], Dict[str, List]]): Keyframes of transform (frame, location, rotation,
+                scale, and interpolation), or the dict of lists packed by
+                :meth:`SequenceTransformKey.pack <xrfeitoria.data_structure.models.SequenceTransformKey.pack>`.
         """
         cls.validate_name(name)
         cls._set_transform_keys_in_engine(obj_name=name, transform_keys=transform_keys)
@@ -401,6 +423,18 @@ class ObjectUtilsBlender(ObjectUtilsBase):
         """
         return bpy.data.objects.keys()
 
+    @staticmethod
+    def _object_exists_in_engine(name: str) -> bool:
+        """Check if an object exists in this blend file.
+
+        Args:
+            name (str): Name of the object.
+
+        Returns:
+            bool: True if the object exists.
+        """
+        return bpy.data.objects.get(name) is not None
+
     @staticmethod
     def _generate_obj_name_in_engine(obj_type: 'Literal["camera", "actor"]') -> str:
         """Generate a name for the new object.
@@ -478,41 +512,61 @@ class ObjectUtilsBlender(ObjectUtilsBase):
     @staticmethod
     def _set_transform_keys_in_engine(
         obj_name: str,
-        transform_keys: 'List[Dict]',
+        transform_keys: 'Union[List[Dict], Dict]',
     ) -> None:
         """Set keyframe of the object in Blender.
 
         Args:
             obj_name (str): Name of the object.
-            transform_keys (List[Dict]): Keyframes of transform (location, rotation, scale, and interpolation).
+            transform_keys (Union[List[Dict], Dict]): Keyframes of transform (location, rotation, scale,
+                and interpolation), as a single dict, a list of dicts or a dict of lists.
         """
+        if not transform_keys:
+            return
+        if isinstance(transform_keys, dict) and not isinstance(transform_keys['frame'], list):
+            transform_keys = [transform_keys]
+        if isinstance(transform_keys, list):
+            transform_keys = {field: [key[field] for key in transform_keys] for field in transform_keys[0].keys()}
+
         obj = bpy.data.objects[obj_name]
-        for i, key in enumerate(transform_keys):
-            ## insert keyframes
-            # https://docs.blender.org/api/current/bpy.types.bpy_struct.html
-            if key['location']:
-                obj.location = key['location']
-                obj.keyframe_insert(data_path='location', frame=key['frame'])
-            if key['rotation']:
-                obj.rotation_euler = [math.radians(i) for i in key['rotation']]
-                obj.keyframe_insert(data_path='rotation_euler', frame=key['frame'])
-            if key['scale']:
-                obj.scale = key['scale']
-                obj.keyframe_insert(data_path='scale', frame=key['frame'])
-
-            ## set interpolation mode
-            # https://blender.stackexchange.com/questions/260149/set-keyframe-interpolation-constant-while-setting-a-keyframe-in-blender-python
-            if obj.animation_data and obj.animation_data.action:
-                obj_action = bpy.data.actions.get(obj.animation_data.action.name)
-                if key['location']:
-                    obj_location_fcurve = obj_action.fcurves.find('location')
-                    obj_location_fcurve.keyframe_points[i].interpolation = transform_keys[i]['interpolation']
-                if key['rotation']:
-                    obj_rotation_fcurve = obj_action.fcurves.find('rotation_euler')
-                    obj_rotation_fcurve.keyframe_points[i].interpolation = transform_keys[i]['interpolation']
-                if key['scale']:
-                    obj_scale_fcurve = obj_action.fcurves.find('scale')
-                    obj_scale_fcurve.keyframe_points[i].interpolation = transform_keys[i]['interpolation']
+        if obj.animation_data is None:
+            obj.animation_data_create()
+        if obj.animation_data.action is None:
+            obj.animation_data.action = bpy.data.actions.new(name=f'{obj.name}Action')
+        action = obj.animation_data.action
+
+        # write the keyframes of each fcurve in bulk, instead of `obj.keyframe_insert` per key
+        # https://docs.blender.org/api/current/bpy.types.FCurveKeyframePoints.html
+        for data_path, field in (('location', 'location'), ('rotation_euler', 'rotation'), ('scale', 'scale')):
+            indices = [i for i, value in enumerate(transform_keys[field]) if value]
+            if not indices:
+                continue
+            frames = np.array([transform_keys['frame'][i] for i in indices], dtype=np.float32)
+            values = np.array([transform_keys[field][i] for i in indices], dtype=np.float32)
+            if field == 'rotation':
+                values = np.radians(values)
+            interpolations = [transform_keys['interpolation'][i] for i in indices]
+
+            # `values.T[axis]` instead of `values[:, axis]`, which `astunparse` can not round-trip
+            for axis, axis_values in enumerate(values.T):
+                fcurve = action.fcurves.find(data_path, index=axis)
+                if fcurve is None:
+                    fcurve = action.fcurves.new(data_path, index=axis, action_group='Object Transforms')
+                if len(fcurve.keyframe_points) > 0:
+                    # merge into the existing keyframes, replacing the ones on the same frames
+                    for frame, value, interpolation in zip(frames, axis_values, interpolations):
+                        point = fcurve.keyframe_points.insert(float(frame), float(value), options={'REPLACE', 'FAST'})
+                        point.interpolation = interpolation
+                else:
+                    fcurve.keyframe_points.add(len(indices))
+                    co = np.stack([frames, axis_values], axis=1)
+                    fcurve.keyframe_points.foreach_set('co', co.ravel())
+                    for point, interpolation in zip(fcurve.keyframe_points, interpolations):
+                        point.interpolation = interpolation
+                fcurve.update()
+
+            # same as `obj.keyframe_insert`, leave the property at the value of the last key
+            setattr(obj, data_path, values[-1].tolist())
 
     @staticmethod
     def _set_origin_in_engine(name: str) -> None:
@@ -615,6 +669,10 @@ class ObjectUtilsUnreal(ObjectUtilsBase):
     def _get_all_objects_in_engine() -> 'List[str]':
         return XRFeitoriaUnrealFactory.utils_actor.get_all_actors_name()
 
+    @staticmethod
+    def _object_exists_in_engine(name: str) -> bool:
+        return name in XRFeitoriaUnrealFactory.utils_actor.get_all_actors_name()
+
     # ------- Setter ------- #
 
     @staticmethod
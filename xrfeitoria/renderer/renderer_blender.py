@@ -187,6 +187,8 @@ class RendererBlender(RendererBase):
             )
             return
 
+        from ..camera.camera_parameter import CameraParameter  # isort:skip
+
         process: subprocess.Popen = _tls.cache.get('engine_process')
         in_background = blender_functions.is_background_mode()
         if use_gpu:
@@ -237,12 +239,15 @@ class RendererBlender(RendererBase):
 
             # ------ post-processing ------ #
 
-            # export camera parameters
-            for camera_name in active_cameras:
-                camera = CameraBlender(name=camera_name)
-                camera.dump_params(
-                    output_path=job.output_path / RenderOutputEnumBlender.camera_params.value / f'{camera_name}.json'
-                )
+            # export camera parameters, fetched in one call
+            if active_cameras:
+                camera_params_dir = job.output_path / RenderOutputEnumBlender.camera_params.value
+                camera_params_dir.mkdir(parents=True, exist_ok=True)
+                Ks, Rs, Ts = CameraBlender.get_KRT_batch(active_cameras)
+                for camera_name, K, R, T in zip(active_cameras, Ks, Rs, Ts):
+                    camera_param_path = (camera_params_dir / f'{camera_name}.json').as_posix()
+                    CameraParameter(K=K, R=R, T=T, world2cam=True).dump(camera_param_path)
+                    logger.debug(f'Camera parameters dumped to "{camera_param_path}"')
 
             # arrange output
             if job.arrange_file_structure:
@@ -60,6 +60,52 @@ class RendererUnreal(RendererBase):
         Note:
             The motion blur is turned off by default. If you want to turn it on, please set ``r.MotionBlurQuality`` to a non-zero value in ``console_variables``.
         """
+        job = cls._make_job(
+            map_path=map_path,
+            sequence_path=sequence_path,
+            output_path=output_path,
+            resolution=resolution,
+            render_passes=render_passes,
+            file_name_format=file_name_format,
+            console_variables=console_variables,
+            anti_aliasing=anti_aliasing,
+            export_audio=export_audio,
+        )
+        cls._add_job_in_engine(job.model_dump(mode='json'))
+        cls.render_queue.append(job)
+
+    @classmethod
+    def add_jobs(cls, jobs: 'List[Dict[str, Any]]') -> None:
+        """Add multiple rendering jobs to the renderer queue with a single RPC call.
+
+        Args:
+            jobs (List[Dict[str, Any]]): Keyword arguments of each job, the same as :meth:`add_job`.
+
+        Examples:
+            >>> xf_runner.Renderer.add_jobs(
+            ...     [
+            ...         dict(map_path=..., sequence_path=..., output_path=..., resolution=..., render_passes=...),
+            ...         dict(map_path=..., sequence_path=..., output_path=..., resolution=..., render_passes=...),
+            ...     ]
+            ... )
+        """
+        _jobs = [cls._make_job(**job) for job in jobs]
+        cls._add_jobs_in_engine([job.model_dump(mode='json') for job in _jobs])
+        cls.render_queue.extend(_jobs)
+
+    @staticmethod
+    def _make_job(
+        map_path: str,
+        sequence_path: str,
+        output_path: PathLike,
+        resolution: Tuple[int, int],
+        render_passes: 'List[RenderPass]',
+        file_name_format: str = '{sequence_name}/{render_pass}/{camera_name}/{frame_number}',
+        console_variables: Dict[str, float] = {'r.MotionBlurQuality': 0},
+        anti_aliasing: 'Optional[RenderJob.AntiAliasSetting]' = None,
+        export_audio: bool = False,
+    ) -> 'RenderJob':
+        """Validate the arguments of :meth:`add_job` and build a render job from them."""
         if anti_aliasing is None:
             anti_aliasing = RenderJob.AntiAliasSetting()
 
@@ -71,7 +117,7 @@ class RendererUnreal(RendererBase):
                 "If you want to turn off the motion blur the same as default, set ``console_variables={..., 'r.MotionBlurQuality': 0}``."
             )
 
-        job = RenderJob(
+        return RenderJob(
             map_path=map_path,
             sequence_path=sequence_path,
             output_path=Path(output_path).resolve(),
@@ -82,8 +128,6 @@ class RendererUnreal(RendererBase):
             anti_aliasing=anti_aliasing,
             export_audio=export_audio,
         )
-        cls._add_job_in_engine(job.model_dump(mode='json'))
-        cls.render_queue.append(job)
 
     @classmethod
     def save_queue(cls, path: PathLike) -> None:
@@ -185,15 +229,16 @@ class RendererUnreal(RendererBase):
         from rich.spinner import Spinner  # isort:skip
         from ..camera.camera_parameter import CameraParameter  # isort:skip
 
-        def convert_camera(camera_file: Path) -> None:
+        def convert_cameras(camera_files: List[Path]) -> None:
             """Convert camera parameters from `.dat` to `.json` with `xrprimer`.
 
             Args:
-                camera_file (Path): Path to the camera file.
+                camera_files (List[Path]): Paths to the camera files.
             """
-            cam_param = CameraParameter.from_bin(camera_file)
-            cam_param.dump(camera_file.with_suffix('.json').as_posix())
-            camera_file.unlink()
+            cam_params = CameraParameter.from_bin_batch(camera_files)
+            for camera_file, cam_param in zip(camera_files, cam_params):
+                cam_param.dump(camera_file.with_suffix('.json').as_posix())
+                camera_file.unlink()
 
         def convert_actor_infos(folder: Path) -> None:
             """Convert stencil value from `.dat` to `.npz`. Merge all actor info files
@@ -292,8 +337,7 @@ class RendererUnreal(RendererBase):
 
             # 1. convert camera parameters from `.bat` to `.json` with xrprimer
             # TODO: remove warmup-frames?
-            for camera_file in sorted(seq_path.glob(f'{RenderOutputEnumUnreal.camera_params.value}/*/*.dat')):
-                convert_camera(camera_file)
+            convert_cameras(sorted(seq_path.glob(f'{RenderOutputEnumUnreal.camera_params.value}/*/*.dat')))
 
             # 2. convert actor infos from `.dat` to `.json`
             for actor_info_folder in sorted(seq_path.glob(f'{RenderOutputEnumUnreal.actor_infos.value}/*')):
@@ -312,6 +356,13 @@ class RendererUnreal(RendererBase):
         _job = XRFeitoriaUnrealFactory.constants.RenderJobUnreal(**job)
         XRFeitoriaUnrealFactory.CustomMoviePipeline.add_job_to_queue(_job)
 
+    @staticmethod
+    def _add_jobs_in_engine(jobs: 'List[Dict[str, Any]]') -> None:
+        """Add multiple render jobs to the render queue in one call."""
+        for job in jobs:
+            _job = XRFeitoriaUnrealFactory.constants.RenderJobUnreal(**job)
+            XRFeitoriaUnrealFactory.CustomMoviePipeline.add_job_to_queue(_job)
+
     @staticmethod
     def _render_in_engine() -> None:
         """Render the scene with default settings.
@@ -8,7 +8,7 @@ import re
 import sys
 import textwrap
 import types
-from functools import wraps
+from functools import lru_cache, wraps
 from inspect import BoundArguments, signature
 from pathlib import Path
 from typing import Any, Callable, List, Optional, Tuple
@@ -30,7 +30,7 @@ class RPCFactory:
     file_path = None
     remap_pairs = []
     default_imports = []
-    registered_function_names = []
+    registered_function_names = set()
 
     @classmethod
     def clear(cls):
@@ -185,7 +185,7 @@ class RPCFactory:
                 additional_paths = sys.path
 
             response = cls.rpc_client.proxy.add_new_callable(function.__name__, '\n'.join(code), additional_paths)
-            cls.registered_function_names.append(function.__name__)
+            cls.registered_function_names.add(function.__name__)
             _code = '\n'.join(code)
             logger.log('RPC', f'code:\n{_code}')
             logger.log('RPC', f'response: {response}')
@@ -214,12 +214,6 @@ class RPCFactory:
         code = cls._register(function)
         remote_function = getattr(cls.rpc_client.proxy, function.__name__)
 
-        current_frame = inspect.currentframe()
-        outer_frame_info = inspect.getouterframes(current_frame)
-        # step back 2 frames in the callstack
-        caller_frame = outer_frame_info[2][0]
-        # create a trace back that is relevant to the remote code rather than the code transporting it
-        call_traceback = types.TracebackType(None, caller_frame, caller_frame.f_lasti, caller_frame.f_lineno)
         # call the remote function
         if not cls.rpc_client.marshall_exceptions:
             # if exceptions are not marshalled then receive the default Fault
@@ -229,14 +223,20 @@ class RPCFactory:
         try:
             return remote_function(*args)
         except Exception as exception:
+            # step back 2 frames in the callstack
+            caller_frame = sys._getframe(2)
+            # create a trace back that is relevant to the remote code rather than the code transporting it
+            call_traceback = types.TracebackType(None, caller_frame, caller_frame.f_lasti, caller_frame.f_lineno)
             stack_trace = str(exception) + get_line_link(function)
             if isinstance(exception, Fault):
                 raise Fault(exception.faultCode, exception.faultString)
             raise exception.__class__(stack_trace).with_traceback(call_traceback)
 
 
+@lru_cache(maxsize=None)
 def is_in_engine() -> bool:
-    """Returns True if the code is running in the engine.
+    """Returns True if the code is running in the engine. The result is cached since
+    it does not change within a process.
 
     Args:
         True if the code is running in the engine.
@@ -290,18 +290,23 @@ def remote_call(
     """
 
     def decorator(function):
+        # resolve everything that does not depend on the arguments once, instead of per call
+        func_signature = signature(function)
+        class_name = function.__qualname__.split('.')[0]
+        source_validated = False
+
         @wraps(function)
         def wrapper(*args, **kwargs):
+            nonlocal source_validated
             if is_in_engine():
                 return function(*args, **kwargs)
 
             # remove the self argument (args[0]) if it is the same as the class name
-            if len(args) > 0 and args[0].__class__.__name__ == function.__qualname__.split('.')[0]:
+            if len(args) > 0 and args[0].__class__.__name__ == class_name:
                 args = args[1:]
 
             # convert kwargs arguments to positional
             # https://stackoverflow.com/questions/33448997/convert-kwargs-arguments-to-positional
-            func_signature = signature(function)
             bound_arguments: BoundArguments = func_signature.bind(*args, **kwargs)
             bound_arguments.apply_defaults()
             args = bound_arguments.args
@@ -314,7 +319,9 @@ def remote_call(
                 if isinstance(arg, Path):
                     args[index] = arg.as_posix()
 
-            validate_file_is_saved(function)
+            if not source_validated:
+                validate_file_is_saved(function)
+                source_validated = True
             validate_key_word_parameters(function, kwargs)
             RPCFactory.setup(port=port, remap_pairs=remap_pairs, default_imports=default_imports)
             return RPCFactory.run_function_remotely(function, args)
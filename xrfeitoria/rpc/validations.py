@@ -11,6 +11,9 @@ from .exceptions import (
     UnsupportedArgumentType,
 )
 
+# argument types that can be sent to the server
+SUPPORTED_TYPES = (str, int, float, tuple, list, dict, bool)
+
 
 def get_source_file_path(function):
     """Gets the full path to the source code.
@@ -39,14 +42,13 @@ def validate_arguments(function, args):
     :param callable function: A function reference.
     :param tuple(Any) args: A list of arguments.
     """
-    supported_types = [str, int, float, tuple, list, dict, bool]
-    line_link = get_line_link(function)
     for arg in args:
         if arg is None:
             continue
 
-        if type(arg) not in supported_types:
-            raise UnsupportedArgumentType(function, arg, supported_types, line_link=line_link)
+        if type(arg) not in SUPPORTED_TYPES:
+            line_link = get_line_link(function)
+            raise UnsupportedArgumentType(function, arg, list(SUPPORTED_TYPES), line_link=line_link)
 
 
 def validate_test_case_class(cls):
@@ -81,6 +81,15 @@ class SequenceBase(ABC):
         logger.info(f'<<<< [red]Closed[/red] sequence "{cls.name}" <<<<')
         cls.name = None
 
+    @classmethod
+    def _dispatch(cls, op: str, **kwargs) -> None:
+        """Call the RPC method ``op`` of this class with ``kwargs``.
+
+        Subclasses may override this to defer the call, e.g. to batch several
+        operations into one RPC call.
+        """
+        getattr(cls, op)(**kwargs)
+
     # ------ import actor ------ #
     @classmethod
     def import_actor(
@@ -118,7 +127,7 @@ class SequenceBase(ABC):
         cls._import_actor_in_engine(
             file_path=file_path,
             actor_name=actor_name,
-            transform_keys=transform_keys.model_dump(),
+            transform_keys=SequenceTransformKey.pack(transform_keys),
             stencil_value=stencil_value,
         )
         logger.info(f'[cyan]Imported[/cyan] actor "{actor_name}" in sequence "{cls.name}"')
@@ -147,8 +156,9 @@ class SequenceBase(ABC):
         if camera_name is None:
             camera_name = cls._object_utils.generate_obj_name(obj_type='camera')
         transform_keys = SequenceTransformKey(frame=0, location=location, rotation=rotation, interpolation='CONSTANT')
-        cls._spawn_camera_in_engine(
-            transform_keys=transform_keys.model_dump(),
+        cls._dispatch(
+            '_spawn_camera_in_engine',
+            transform_keys=SequenceTransformKey.pack(transform_keys),
             fov=fov,
             aspect_ratio=aspect_ratio,
             camera_name=camera_name,
@@ -172,19 +182,19 @@ class SequenceBase(ABC):
             aspect_ratio (float, optional): Aspect ratio of the camera. Defaults to 16.0 / 9.0.
             camera_name (str, optional): Name of the camera. Defaults to 'Camera'.
         """
-        if not isinstance(transform_keys, list):
-            transform_keys = [transform_keys]
-        transform_keys = [i.model_dump() for i in transform_keys]
+        transform_keys = SequenceTransformKey.pack(transform_keys)
         if camera_name is None:
             camera_name = cls._object_utils.generate_obj_name(obj_type='camera')
-        cls._spawn_camera_in_engine(
+        cls._dispatch(
+            '_spawn_camera_in_engine',
             transform_keys=transform_keys,
             fov=fov,
             aspect_ratio=aspect_ratio,
             camera_name=camera_name,
         )
         logger.info(
-            f'[cyan]Spawned[/cyan] camera "{camera_name}" with {len(transform_keys)} keys in sequence "{cls.name}"'
+            f'[cyan]Spawned[/cyan] camera "{camera_name}" '
+            f'with {len(transform_keys["frame"])} keys in sequence "{cls.name}"'
         )
         return cls._camera(name=camera_name)
 
@@ -220,7 +230,7 @@ class SequenceBase(ABC):
             shape_name = cls._object_utils.generate_obj_name(obj_type=type)
         cls._spawn_shape_in_engine(
             type=type,
-            transform_keys=transform_keys.model_dump(),
+            transform_keys=SequenceTransformKey.pack(transform_keys),
             shape_name=shape_name,
             stencil_value=stencil_value,
             **kwargs,
@@ -249,9 +259,7 @@ class SequenceBase(ABC):
         Returns:
             ShapeBlender or ShapeUnreal: New added shape.
         """
-        if not isinstance(transform_keys, list):
-            transform_keys = [transform_keys]
-        transform_keys = [i.model_dump() for i in transform_keys]
+        transform_keys = SequenceTransformKey.pack(transform_keys)
         if shape_name is None:
             shape_name = cls._object_utils.generate_obj_name(obj_type=type)
         cls._spawn_shape_in_engine(
@@ -263,7 +271,7 @@ class SequenceBase(ABC):
         )
         logger.info(
             f"[cyan]Spawned[/cyan] {type.capitalize()} '{shape_name}' "
-            f"with {len(transform_keys)} keys in sequence '{cls.name}'."
+            f"with {len(transform_keys['frame'])} keys in sequence '{cls.name}'."
         )
         return cls._actor(name=shape_name)
 
@@ -294,8 +302,9 @@ class SequenceBase(ABC):
         fov = camera.fov if fov is None else fov
 
         transform_keys = SequenceTransformKey(frame=0, location=location, rotation=rotation, interpolation='CONSTANT')
-        cls._use_camera_in_engine(
-            transform_keys=transform_keys.model_dump(),
+        cls._dispatch(
+            '_use_camera_in_engine',
+            transform_keys=SequenceTransformKey.pack(transform_keys),
             fov=fov,
             aspect_ratio=aspect_ratio,
             camera_name=camera_name,
@@ -321,18 +330,18 @@ class SequenceBase(ABC):
             aspect_ratio (float, optional): The aspect ratio of the camera. Defaults to None.
         """
         camera_name = camera.name
-        if not isinstance(transform_keys, list):
-            transform_keys = [transform_keys]
-        transform_keys = [i.model_dump() for i in transform_keys]
+        transform_keys = SequenceTransformKey.pack(transform_keys)
         fov = camera.fov if fov is None else fov
-        cls._use_camera_in_engine(
+        cls._dispatch(
+            '_use_camera_in_engine',
             transform_keys=transform_keys,
             fov=fov,
             aspect_ratio=aspect_ratio,
             camera_name=camera_name,
         )
         logger.info(
-            f'[cyan]Used[/cyan] camera "{camera_name}" with {len(transform_keys)} keys in sequence "{cls.name}"'
+            f'[cyan]Used[/cyan] camera "{camera_name}" '
+            f'with {len(transform_keys["frame"])} keys in sequence "{cls.name}"'
         )
 
     @classmethod
@@ -370,9 +379,10 @@ class SequenceBase(ABC):
         transform_keys = SequenceTransformKey(
             frame=0, location=location, rotation=rotation, scale=scale, interpolation='CONSTANT'
         )
-        cls._use_actor_in_engine(
+        cls._dispatch(
+            '_use_actor_in_engine',
             actor_name=actor_name,
-            transform_keys=transform_keys.model_dump(),
+            transform_keys=SequenceTransformKey.pack(transform_keys),
             stencil_value=stencil_value,
             anim_asset_path=anim_asset_path,
         )
@@ -401,18 +411,20 @@ class SequenceBase(ABC):
             Default to None. If None, the actor's current animation is used, else the specified animation is used.
         """
         actor_name = actor.name
-        if not isinstance(transform_keys, list):
-            transform_keys = [transform_keys]
-        transform_keys = [i.model_dump() for i in transform_keys]
+        transform_keys = SequenceTransformKey.pack(transform_keys)
         stencil_value = actor.stencil_value if stencil_value is None else stencil_value
 
-        cls._use_actor_in_engine(
+        cls._dispatch(
+            '_use_actor_in_engine',
             actor_name=actor_name,
             transform_keys=transform_keys,
             stencil_value=stencil_value,
             anim_asset_path=anim_asset_path,
         )
-        logger.info(f'[cyan]Used[/cyan] actor "{actor_name}" with {len(transform_keys)} keys in sequence "{cls.name}"')
+        logger.info(
+            f'[cyan]Used[/cyan] actor "{actor_name}" '
+            f'with {len(transform_keys["frame"])} keys in sequence "{cls.name}"'
+        )
 
     @classmethod
     def add_to_renderer(
@@ -17,7 +17,7 @@ except ModuleNotFoundError:
     pass
 
 try:
-    from ..data_structure.models import RenderPass, TransformKeys  # isort:skip
+    from ..data_structure.models import RenderPass, SequenceTransformKey, TransformKeys  # isort:skip
 except (ImportError, ModuleNotFoundError):
     pass
 
@@ -62,6 +62,28 @@ class SequenceBlender(SequenceBase):
         cls._object_utils.set_transform_keys(name=actor.name, transform_keys=transform_keys)
         return actor
 
+    @classmethod
+    def spawn_shapes_with_keys(cls, specs: 'List[Dict]') -> 'List[ActorBlender]':
+        """Spawn several shapes with keyframes in the sequence with a single RPC call.
+
+        Args:
+            specs (List[Dict]): Keyword arguments of :meth:`spawn_shape_with_keys` for each shape,
+                e.g. ``{'type': 'cube', 'transform_keys': [...], 'stencil_value': 2, 'size': 2.0}``.
+                Names that are not given are generated in the engine.
+
+        Returns:
+            List[ActorBlender]: New added shapes, in the same order as ``specs``.
+        """
+        specs = [dict(spec, transform_keys=SequenceTransformKey.pack(spec['transform_keys'])) for spec in specs]
+        cls._object_utils.validate_new_names([spec['shape_name'] for spec in specs if spec.get('shape_name')])
+        names = cls._spawn_shapes_in_engine(specs)
+        for spec, name in zip(specs, names):
+            logger.info(
+                f"[cyan]Spawned[/cyan] {spec['type'].capitalize()} '{name}' "
+                f"with {len(spec['transform_keys']['frame'])} keys in sequence '{cls.name}'."
+            )
+        return [cls._actor(name=name) for name in names]
+
     @classmethod
     def add_to_renderer(
         cls,
@@ -179,16 +201,11 @@ class SequenceBlender(SequenceBase):
             actor_name (str, optional): Name of the actor. Defaults to 'Actor'.
             stencil_value (int, optional): Stencil value of the actor. Defaults to 1.
         """
-        if not isinstance(transform_keys, list):
-            transform_keys = [transform_keys]
-
         ActorBlender._import_actor_from_file_in_engine(file_path=file_path, actor_name=actor_name)
         ObjectUtilsBlender._set_transform_keys_in_engine(obj_name=actor_name, transform_keys=transform_keys)
         # XXX: set stencil value. may use actor property
         actor = bpy.data.objects[actor_name]
-        actor.pass_index = stencil_value
-        for child in actor.children_recursive:
-            child.pass_index = stencil_value
+        XRFeitoriaBlenderFactory.set_pass_index(actor, stencil_value)
 
     @staticmethod
     def _spawn_camera_in_engine(
@@ -204,9 +221,6 @@ class SequenceBlender(SequenceBase):
             fov (float, optional): Field of view of the camera lens, in degrees. Defaults to 90.0.
             camera_name (str, optional): Name of the camera. Defaults to 'Camera'.
         """
-        if not isinstance(transform_keys, list):
-            transform_keys = [transform_keys]
-
         CameraBlender._spawn_in_engine(camera_name=camera_name, fov=fov)
         ObjectUtilsBlender._set_transform_keys_in_engine(obj_name=camera_name, transform_keys=transform_keys)
 
@@ -243,9 +257,6 @@ class SequenceBlender(SequenceBase):
             radius1 (float in [0, inf], optional): Radius1. Defaults to 0.0. (unit: meter)
             radius2 (float in [0, inf], optional): Radius2. Defaults to 2.0. (unit: meter)
         """
-        if not isinstance(transform_keys, list):
-            transform_keys = [transform_keys]
-
         ShapeBlenderWrapper._spawn_shape_in_engine(
             name=shape_name,
             type=type,
@@ -258,13 +269,27 @@ class SequenceBlender(SequenceBase):
             depth=depth,
             radius1=radius1,
             radius2=radius2,
+            stencil_value=stencil_value,
         )
         ObjectUtilsBlender._set_transform_keys_in_engine(obj_name=shape_name, transform_keys=transform_keys)
-        # XXX: set stencil value. may use actor property
-        actor = bpy.data.objects[shape_name]
-        actor.pass_index = stencil_value
-        for child in actor.children_recursive:
-            child.pass_index = stencil_value
+
+    @staticmethod
+    def _spawn_shapes_in_engine(specs: 'List[Dict]') -> 'List[str]':
+        """Spawn shapes with keyframes in the engine and return their names.
+
+        Args:
+            specs (List[Dict]): Keyword arguments of ``SequenceBlender._spawn_shape_in_engine`` for each shape.
+
+        Returns:
+            List[str]: Names of the new added shapes.
+        """
+        names = []
+        for spec in specs:
+            spec = spec.copy()
+            spec['shape_name'] = spec.get('shape_name') or ObjectUtilsBlender._generate_obj_name_in_engine(spec['type'])
+            SequenceBlender._spawn_shape_in_engine(**spec)
+            names.append(spec['shape_name'])
+        return names
 
     # -------- use methods -------- #
     @staticmethod
@@ -281,9 +306,6 @@ class SequenceBlender(SequenceBase):
         """
         import math
 
-        if not isinstance(transform_keys, list):
-            transform_keys = [transform_keys]
-
         # get actor by name
         camera = bpy.data.objects[camera_name]
 
@@ -313,9 +335,6 @@ class SequenceBlender(SequenceBase):
         stencil_value: int,
         anim_asset_path: 'Optional[str]' = None,
     ):
-        if not isinstance(transform_keys, list):
-            transform_keys = [transform_keys]
-
         # get actor by name
         actor = bpy.data.objects[actor_name]
 
@@ -342,9 +361,7 @@ class SequenceBlender(SequenceBase):
         level_actor_data.scale = actor.scale
 
         # set level actor's properties
-        actor.pass_index = stencil_value
-        for child in actor.children_recursive:
-            child.pass_index = stencil_value
+        XRFeitoriaBlenderFactory.set_pass_index(actor, stencil_value)
         if action:
             XRFeitoriaBlenderFactory.apply_action_to_actor(action=action, actor=actor)
         ObjectUtilsBlender._set_transform_keys_in_engine(obj_name=actor_name, transform_keys=transform_keys)
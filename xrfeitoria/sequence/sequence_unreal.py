@@ -1,4 +1,5 @@
-from typing import Dict, List, Literal, Optional, Tuple, TypedDict, Union
+from contextlib import contextmanager
+from typing import Any, Dict, List, Literal, Optional, Tuple, TypedDict, Union
 
 from loguru import logger
 
@@ -43,11 +44,38 @@ class SequenceUnreal(SequenceBase):
     _camera = CameraUnreal
     _object_utils = ObjectUtilsUnreal
     _renderer = RendererUnreal
+    _batch_ops: 'Optional[List[Dict[str, Any]]]' = None
+    _paths: 'Optional[Tuple[str, str]]' = None  # (map_path, seq_path) of the opened sequence
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.save()
         self.close()
 
+    @classmethod
+    @contextmanager
+    def batch(cls):
+        """Defer the ``spawn_*`` and ``use_*`` calls inside the block and send them to
+        the engine in a single RPC call when the block exits.
+
+        Objects spawned inside the block do not exist in the engine until the block exits,
+        so give them explicit names instead of relying on generated ones.
+
+        Examples:
+            >>> with xf_runner.Sequence.new(seq_name='test') as seq:
+            ...     with seq.batch():
+            ...         seq.spawn_camera(location=(0, 0, 0), rotation=(0, 0, 0), camera_name='camera')
+            ...         seq.spawn_actor(actor_asset_path='/Engine/BasicShapes/Cube', actor_name='cube')
+        """
+        cls._batch_ops = []
+        try:
+            yield
+            ops = cls._batch_ops
+        finally:
+            cls._batch_ops = None
+        if ops:
+            cls._apply_batch_in_engine(ops)
+            logger.info(f'[cyan]Applied[/cyan] {len(ops)} operations in sequence "{cls.name}"')
+
     @classmethod
     def save(cls) -> None:
         """Save the sequence."""
@@ -103,8 +131,7 @@ class SequenceUnreal(SequenceBase):
             ...         )
             ...     xf_runner.render()
         """
-        map_path = SequenceUnreal._get_map_path_in_engine()
-        sequence_path = SequenceUnreal._get_seq_path_in_engine()
+        map_path, sequence_path = cls._get_paths()
         if anti_aliasing is None:
             anti_aliasing = RenderJobUnreal.AntiAliasSetting()
 
@@ -169,9 +196,10 @@ class SequenceUnreal(SequenceBase):
             actor_name = cls._object_utils.generate_obj_name(obj_type='actor')
         if motion_data is not None:
             motion_data = cls.check_motion_data(actor_asset_path, motion_data)
-        cls._spawn_actor_in_engine(
+        cls._dispatch(
+            '_spawn_actor_in_engine',
             actor_asset_path=actor_asset_path,
-            transform_keys=transform_keys.model_dump(),
+            transform_keys=SeqTransKey.pack(transform_keys),
             anim_asset_path=anim_asset_path,
             motion_data=motion_data,
             actor_name=actor_name,
@@ -205,14 +233,13 @@ class SequenceUnreal(SequenceBase):
         Returns:
             ActorUnreal: The spawned actor.
         """
-        if not isinstance(transform_keys, list):
-            transform_keys = [transform_keys]
-        transform_keys = [i.model_dump() for i in transform_keys]
+        transform_keys = SeqTransKey.pack(transform_keys)
         if actor_name is None:
             actor_name = cls._object_utils.generate_obj_name(obj_type='actor')
         if motion_data is not None:
             motion_data = cls.check_motion_data(actor_asset_path, motion_data)
-        cls._spawn_actor_in_engine(
+        cls._dispatch(
+            '_spawn_actor_in_engine',
             actor_asset_path=actor_asset_path,
             transform_keys=transform_keys,
             anim_asset_path=anim_asset_path,
@@ -221,10 +248,28 @@ class SequenceUnreal(SequenceBase):
             stencil_value=stencil_value,
         )
         logger.info(
-            f'[cyan]Spawned[/cyan] actor "{actor_name}" with {len(transform_keys)} keys in sequence "{cls.name}"'
+            f'[cyan]Spawned[/cyan] actor "{actor_name}" '
+            f'with {len(transform_keys["frame"])} keys in sequence "{cls.name}"'
         )
         return ActorUnreal(actor_name)
 
+    @classmethod
+    def spawn_actors_with_keys(cls, specs: 'List[Dict[str, Any]]') -> List[ActorUnreal]:
+        """Spawns several actors with transform keys in a single RPC call.
+
+        Args:
+            specs (List[Dict[str, Any]]): Keyword arguments of :meth:`spawn_actor_with_keys` for each actor,
+                e.g. ``{'actor_asset_path': ..., 'transform_keys': ..., 'actor_name': ..., 'stencil_value': ...}``.
+
+        Returns:
+            List[ActorUnreal]: The spawned actors, in the order of ``specs``.
+        """
+        if cls._batch_ops is not None:
+            return [cls.spawn_actor_with_keys(**spec) for spec in specs]
+        with cls.batch():
+            actors = [cls.spawn_actor_with_keys(**spec) for spec in specs]
+        return actors
+
     @classmethod
     def add_audio(
         cls,
@@ -249,7 +294,7 @@ class SequenceUnreal(SequenceBase):
         Returns:
             str: engine path to the map corresponding to the sequence.
         """
-        return cls._get_map_path_in_engine()
+        return cls._get_paths()[0]
 
     @classmethod
     def get_seq_path(cls) -> str:
@@ -258,7 +303,7 @@ class SequenceUnreal(SequenceBase):
         Returns:
             str: engine path to the sequence.
         """
-        return cls._get_seq_path_in_engine()
+        return cls._get_paths()[1]
 
     @classmethod
     def set_playback(cls, start_frame: Optional[int] = None, end_frame: Optional[int] = None) -> None:
@@ -325,6 +370,48 @@ class SequenceUnreal(SequenceBase):
                         frame.pop(bone_name)
         return _motion_data_
 
+    @classmethod
+    def _dispatch(cls, op: str, **kwargs) -> None:
+        if cls._batch_ops is None:
+            return super()._dispatch(op, **kwargs)
+        cls._batch_ops.append({'op': op, 'kwargs': kwargs})
+
+    @staticmethod
+    def _unpack_transform_keys(
+        transform_keys: 'Union[List[Dict], Dict]',
+    ) -> 'List[XRFeitoriaUnrealFactory.constants.SequenceTransformKey]':
+        """Unpack the transform keys received in the engine, which can be a dict of a
+        single key, a list of dicts, or a dict of lists packed by
+        :meth:`SequenceTransformKey.pack <xrfeitoria.data_structure.models.SequenceTransformKey.pack>`."""
+        if isinstance(transform_keys, dict):
+            if isinstance(transform_keys['frame'], list):
+                fields = transform_keys.keys()
+                transform_keys = [dict(zip(fields, values)) for values in zip(*transform_keys.values())]
+            else:
+                transform_keys = [transform_keys]
+        if isinstance(transform_keys[0], dict):
+            transform_keys = [XRFeitoriaUnrealFactory.constants.SequenceTransformKey(**k) for k in transform_keys]
+        return transform_keys
+
+    @classmethod
+    def _get_paths(cls) -> Tuple[str, str]:
+        """Get the map path and sequence path of the opened sequence, cached until the
+        sequence is closed."""
+        if cls._paths is None:
+            cls._paths = tuple(cls._get_paths_in_engine())
+        return cls._paths
+
+    @classmethod
+    def _new(cls, *args, **kwargs) -> None:
+        cls._paths = None
+        super()._new(*args, **kwargs)
+
+    @classmethod
+    def close(cls) -> None:
+        """Close the opened sequence."""
+        cls._paths = None
+        super().close()
+
     @classmethod
     def _open(cls, seq_name: str, seq_dir: 'Optional[str]' = None) -> None:
         """Open an exist sequence.
@@ -334,6 +421,7 @@ class SequenceUnreal(SequenceBase):
             seq_dir (Optional[str], optional): Path of the sequence.
                 Defaults to None and fallback to the default path '/Game/XRFeitoriaUnreal/Sequences'.
         """
+        cls._paths = None
         cls._open_seq_in_engine(seq_name=seq_name, seq_dir=seq_dir)
         cls.name = seq_name
         logger.info(f'>>>> [cyan]Opened[/cyan] sequence "{cls.name}" >>>>')
@@ -353,6 +441,14 @@ class SequenceUnreal(SequenceBase):
     ###### RPC METHODS (Private) ########
     #####################################
 
+    @staticmethod
+    def _apply_batch_in_engine(ops: 'List[Dict[str, Any]]') -> None:
+        # bind the class to a name first, the RPC factory only imports names it finds
+        # between separators like `.`, `(` or `=`, which misses `getattr(SequenceUnreal, ...)`
+        seq_cls = SequenceUnreal
+        for op in ops:
+            getattr(seq_cls, op['op'])(**op['kwargs'])
+
     @staticmethod
     def _get_default_seq_dir_in_engine() -> str:
         return XRFeitoriaUnrealFactory.constants.DEFAULT_SEQUENCE_DIR
@@ -383,6 +479,10 @@ class SequenceUnreal(SequenceBase):
     def _get_seq_path_in_engine() -> str:
         return XRFeitoriaUnrealFactory.Sequence.sequence_path
 
+    @staticmethod
+    def _get_paths_in_engine() -> 'Tuple[str, str]':
+        return XRFeitoriaUnrealFactory.Sequence.map_path, XRFeitoriaUnrealFactory.Sequence.sequence_path
+
     @staticmethod
     def _new_seq_in_engine(
         seq_name: str,
@@ -463,10 +563,7 @@ class SequenceUnreal(SequenceBase):
         aspect_ratio: float = 16.0 / 9.0,
         camera_name: str = 'Camera',
     ) -> None:
-        if not isinstance(transform_keys, list):
-            transform_keys = [transform_keys]
-        if isinstance(transform_keys[0], dict):
-            transform_keys = [XRFeitoriaUnrealFactory.constants.SequenceTransformKey(**k) for k in transform_keys]
+        transform_keys = SequenceUnreal._unpack_transform_keys(transform_keys)
 
         XRFeitoriaUnrealFactory.Sequence.add_camera(
             transform_keys=transform_keys,
@@ -482,10 +579,7 @@ class SequenceUnreal(SequenceBase):
         stencil_value: int = 1,
         anim_asset_path: 'Optional[str]' = None,
     ):
-        if not isinstance(transform_keys, list):
-            transform_keys = [transform_keys]
-        if isinstance(transform_keys[0], dict):
-            transform_keys = [XRFeitoriaUnrealFactory.constants.SequenceTransformKey(**k) for k in transform_keys]
+        transform_keys = SequenceUnreal._unpack_transform_keys(transform_keys)
 
         XRFeitoriaUnrealFactory.Sequence.add_actor(
             actor_name=actor_name,
@@ -502,10 +596,7 @@ class SequenceUnreal(SequenceBase):
         actor_name: str = 'Actor',
         stencil_value: int = 1,
     ) -> None:
-        if not isinstance(transform_keys, list):
-            transform_keys = [transform_keys]
-        if isinstance(transform_keys[0], dict):
-            transform_keys = [XRFeitoriaUnrealFactory.constants.SequenceTransformKey(**k) for k in transform_keys]
+        transform_keys = SequenceUnreal._unpack_transform_keys(transform_keys)
 
         actor_path = XRFeitoriaUnrealFactory.utils.import_asset(file_path)
         logger.info(f'actor_path: {actor_path}')
@@ -527,10 +618,7 @@ class SequenceUnreal(SequenceBase):
         aspect_ratio: float = 16.0 / 9.0,
         camera_name: str = 'Camera',
     ) -> None:
-        if not isinstance(transform_keys, list):
-            transform_keys = [transform_keys]
-        if isinstance(transform_keys[0], dict):
-            transform_keys = [XRFeitoriaUnrealFactory.constants.SequenceTransformKey(**k) for k in transform_keys]
+        transform_keys = SequenceUnreal._unpack_transform_keys(transform_keys)
 
         XRFeitoriaUnrealFactory.Sequence.add_camera(
             transform_keys=transform_keys,
@@ -554,10 +642,7 @@ class SequenceUnreal(SequenceBase):
         if anim_asset_path is not None:
             unreal_functions.check_asset_in_engine(anim_asset_path, raise_error=True)
 
-        if not isinstance(transform_keys, list):
-            transform_keys = [transform_keys]
-        if isinstance(transform_keys[0], dict):
-            transform_keys = [XRFeitoriaUnrealFactory.constants.SequenceTransformKey(**k) for k in transform_keys]
+        transform_keys = SequenceUnreal._unpack_transform_keys(transform_keys)
 
         XRFeitoriaUnrealFactory.Sequence.add_actor(
             actor=actor_asset_path,
@@ -575,10 +660,7 @@ class SequenceUnreal(SequenceBase):
         shape_name: str = 'Shape',
         stencil_value: int = 1,
     ) -> None:
-        if not isinstance(transform_keys, list):
-            transform_keys = [transform_keys]
-        if isinstance(transform_keys[0], dict):
-            transform_keys = [XRFeitoriaUnrealFactory.constants.SequenceTransformKey(**k) for k in transform_keys]
+        transform_keys = SequenceUnreal._unpack_transform_keys(transform_keys)
 
         shape_path = XRFeitoriaUnrealFactory.constants.SHAPE_PATHS[type]
         XRFeitoriaUnrealFactory.Sequence.add_actor(
@@ -7,149 +7,88 @@ import numpy as np
 from ..data_structure.constants import Vector
 
 
+def _axis_rot_matrix(axis: str, theta: np.ndarray) -> np.ndarray:
+    """Elementary rotation matrices about one axis, of shape (..., 3, 3)."""
+    c, s = np.cos(theta), np.sin(theta)
+    one, zero = np.ones_like(theta), np.zeros_like(theta)
+    if axis == 'x':
+        rows = [[one, zero, zero], [zero, c, -s], [zero, s, c]]
+    elif axis == 'y':
+        rows = [[c, zero, s], [zero, one, zero], [-s, zero, c]]
+    elif axis == 'z':
+        rows = [[c, -s, zero], [s, c, zero], [zero, zero, one]]
+    else:
+        raise ValueError(f'Unknown axis: {axis}')
+    return np.stack([np.stack(row, axis=-1) for row in rows], axis=-2)
+
+
 def euler_to_rot_matrix(angles: Union[Vector, np.ndarray], order='xyz', degrees: bool = True) -> np.ndarray:
     """Convert Euler angles to rotation matrix.
 
     This function is to avoid importing third-party libraries like `transforms3d` or `scipy`, for saving the size of the package.
 
+    The rotations are intrinsic, i.e. ``order='xyz'`` gives ``Rx @ Ry @ Rz``.
+    A batch of angles of shape (N, 3) is converted in one call.
+
     Args:
-        angles (Tuple[float, float, float]): Rotation angles in degrees or radians.
+        angles (Tuple[float, float, float]): Rotation angles in degrees or radians, of shape (3,) or (N, 3).
         order (str, optional): Rotation order. Defaults to 'xyz'.
         degrees (bool, optional): Whether the input angles are in degrees. Defaults to True.
     Returns:
-        ndarray: Rotation matrix 3x3.
+        ndarray: Rotation matrix 3x3, or of shape (N, 3, 3) for batched angles.
 
     Examples:
         >>> euler_to_to_matrix((0, 0, 0), order='xyz')
         array([[ 1.,  0.,  0.],
                [ 0.,  1.,  0.],
                [ 0.,  0.,  1.]])
-
-    References:
-        https://programming-surgeon.com/en/euler-angle-python-en/
     """
+    angles = np.asarray(angles, dtype=np.float64)
     if degrees:
         angles = np.deg2rad(angles)
 
-    theta1, theta2, theta3 = angles
-    c1 = np.cos(theta1)
-    s1 = np.sin(theta1)
-    c2 = np.cos(theta2)
-    s2 = np.sin(theta2)
-    c3 = np.cos(theta3)
-    s3 = np.sin(theta3)
-
-    if order == 'xzx':
-        matrix = np.array(
-            [
-                [c2, -c3 * s2, s2 * s3],
-                [c1 * s2, c1 * c2 * c3 - s1 * s3, -c3 * s1 - c1 * c2 * s3],
-                [s1 * s2, c1 * s3 + c2 * c3 * s1, c1 * c3 - c2 * s1 * s3],
-            ]
-        )
-    elif order == 'xyx':
-        matrix = np.array(
-            [
-                [c2, s2 * s3, c3 * s2],
-                [s1 * s2, c1 * c3 - c2 * s1 * s3, -c1 * s3 - c2 * c3 * s1],
-                [-c1 * s2, c3 * s1 + c1 * c2 * s3, c1 * c2 * c3 - s1 * s3],
-            ]
-        )
-    elif order == 'yxy':
-        matrix = np.array(
-            [
-                [c1 * c3 - c2 * s1 * s3, s1 * s2, c1 * s3 + c2 * c3 * s1],
-                [s2 * s3, c2, -c3 * s2],
-                [-c3 * s1 - c1 * c2 * s3, c1 * s2, c1 * c2 * c3 - s1 * s3],
-            ]
-        )
-    elif order == 'yzy':
-        matrix = np.array(
-            [
-                [c1 * c2 * c3 - s1 * s3, -c1 * s2, c3 * s1 + c1 * c2 * s3],
-                [c3 * s2, c2, s2 * s3],
-                [-c1 * s3 - c2 * c3 * s1, s1 * s2, c1 * c3 - c2 * s1 * s3],
-            ]
-        )
-    elif order == 'zyz':
-        matrix = np.array(
-            [
-                [c1 * c2 * c3 - s1 * s3, -c3 * s1 - c1 * c2 * s3, c1 * s2],
-                [c1 * s3 + c2 * c3 * s1, c1 * c3 - c2 * s1 * s3, s1 * s2],
-                [-c3 * s2, s2 * s3, c2],
-            ]
-        )
-    elif order == 'zxz':
-        matrix = np.array(
-            [
-                [c1 * c3 - c2 * s1 * s3, -c1 * s3 - c2 * c3 * s1, s1 * s2],
-                [c3 * s1 + c1 * c2 * s3, c1 * c2 * c3 - s1 * s3, -c1 * s2],
-                [s2 * s3, c3 * s2, c2],
-            ]
-        )
-    elif order == 'xyz':
-        matrix = np.array(
-            [
-                [c2 * c3, -c2 * s3, s2],
-                [c1 * s3 + c3 * s1 * s2, c1 * c3 - s1 * s2 * s3, -c2 * s1],
-                [s1 * s3 - c1 * c3 * s2, c3 * s1 + c1 * s2 * s3, c1 * c2],
-            ]
-        )
-    elif order == 'xzy':
-        matrix = np.array(
-            [
-                [c2 * c3, -s2, c2 * s3],
-                [s1 * s3 + c1 * c3 * s2, c1 * c2, c1 * s2 * s3 - c3 * s1],
-                [c3 * s1 * s2 - c1 * s3, c2 * s1, c1 * c3 + s1 * s2 * s3],
-            ]
-        )
-    elif order == 'yxz':
-        matrix = np.array(
-            [
-                [c1 * c3 + s1 * s2 * s3, c3 * s1 * s2 - c1 * s3, c2 * s1],
-                [c2 * s3, c2 * c3, -s2],
-                [c1 * s2 * s3 - c3 * s1, c1 * c3 * s2 + s1 * s3, c1 * c2],
-            ]
-        )
-    elif order == 'yzx':
-        matrix = np.array(
-            [
-                [c1 * c2, s1 * s3 - c1 * c3 * s2, c3 * s1 + c1 * s2 * s3],
-                [s2, c2 * c3, -c2 * s3],
-                [-c2 * s1, c1 * s3 + c3 * s1 * s2, c1 * c3 - s1 * s2 * s3],
-            ]
-        )
-    elif order == 'zyx':
-        matrix = np.array(
-            [
-                [c1 * c2, c1 * s2 * s3 - c3 * s1, s1 * s3 + c1 * c3 * s2],
-                [c2 * s1, c1 * c3 + s1 * s2 * s3, c3 * s1 * s2 - c1 * s3],
-                [-s2, c2 * s3, c2 * c3],
-            ]
-        )
-    elif order == 'zxy':
-        matrix = np.array(
-            [
-                [c1 * c3 - s1 * s2 * s3, -c2 * s1, c1 * s3 + c3 * s1 * s2],
-                [c3 * s1 + c1 * s2 * s3, c1 * c2, s1 * s3 - c1 * c3 * s2],
-                [-c2 * s3, s2, c2 * c3],
-            ]
-        )
-
+    matrix = _axis_rot_matrix(order[0], angles[..., 0])
+    matrix = matrix @ _axis_rot_matrix(order[1], angles[..., 1])
+    matrix = matrix @ _axis_rot_matrix(order[2], angles[..., 2])
     return matrix
 
 
+def euler_xyz_to_quat(angles: Union[Vector, np.ndarray], degrees: bool = True) -> np.ndarray:
+    """Convert intrinsic 'xyz' Euler angles to a unit quaternion, i.e. ``qx * qy * qz``.
+
+    Args:
+        angles (Tuple[float, float, float]): Rotation angles in degrees or radians, of shape (3,) or (N, 3).
+        degrees (bool, optional): Whether the input angles are in degrees. Defaults to True.
+
+    Returns:
+        ndarray: Quaternion in 'xyzw' order, of shape (4,) or (N, 4).
+    """
+    angles = np.asarray(angles, dtype=np.float64)
+    if degrees:
+        angles = np.deg2rad(angles)
+    half = angles / 2
+    cx, cy, cz = np.moveaxis(np.cos(half), -1, 0)
+    sx, sy, sz = np.moveaxis(np.sin(half), -1, 0)
+
+    x = sx * cy * cz + cx * sy * sz
+    y = cx * sy * cz - sx * cy * sz
+    z = cx * cy * sz + sx * sy * cz
+    w = cx * cy * cz - sx * sy * sz
+    return np.stack([x, y, z, w], axis=-1)
+
+
 def quat_to_rot_matrix(quat, order: Literal['xyzw', 'wxyz'] = 'xyzw') -> np.ndarray:
     """Convert a quaternion to a rotation matrix.
 
     This function is to avoid importing third-party libraries like `transforms3d` or `scipy`, for saving the size of the package.
 
     Args:
-        quat: A list or array-like object representing the quaternion in the order specified by the `order` parameter.
+        quat: A list or array-like object representing the quaternion in the order specified by the `order` parameter,
+            of shape (4,) or (N, 4).
         order: The order of the quaternion elements. Must be either 'xyzw' or 'wxyz'. Defaults to 'xyzw'.
 
     Returns:
-        A 3x3 numpy array representing the rotation matrix.
+        A 3x3 numpy array representing the rotation matrix, or of shape (N, 3, 3).
 
     Raises:
         ValueError: If the `order` parameter is not 'xyzw' or 'wxyz'.
@@ -160,10 +99,11 @@ def quat_to_rot_matrix(quat, order: Literal['xyzw', 'wxyz'] = 'xyzw') -> np.ndar
                [ 0., -1.,  0.],
                [ 0.,  0., -1.]])
     """
+    quat = np.asarray(quat)
     if order == 'xyzw':
-        x, y, z, w = quat
+        x, y, z, w = np.moveaxis(quat, -1, 0)
     elif order == 'wxyz':
-        w, x, y, z = quat
+        w, x, y, z = np.moveaxis(quat, -1, 0)
     else:
         raise ValueError(f'Unknown order: {order}')
 
@@ -177,7 +117,8 @@ def quat_to_rot_matrix(quat, order: Literal['xyzw', 'wxyz'] = 'xyzw') -> np.ndar
     r32 = 2 * (y * z + x * w)
     r33 = 1 - 2 * (x**2 + y**2)
 
-    return np.array([[r11, r12, r13], [r21, r22, r23], [r31, r32, r33]])
+    matrix = np.stack([r11, r12, r13, r21, r22, r23, r31, r32, r33], axis=-1)
+    return matrix.reshape(quat.shape[:-1] + (3, 3))
 
 
 class ConverterMotion:
@@ -246,6 +187,8 @@ class ConverterUnreal:
             [1, 0, 0],
         ]
     )
+    # rotate 90 degree around y-axis, applied in `quat_from_ue`
+    rotation_offset_y90 = euler_to_rot_matrix([0, 90.0, 0.0], 'xyz', degrees=True)
 
     @classmethod
     def rotation_camera_from_ue(cls, euler, degrees=True) -> np.ndarray:
@@ -253,14 +196,15 @@ class ConverterUnreal:
         Note: convert to left-handed
 
         Args:
-            euler (np.ndarray): of shape (3,)
+            euler (np.ndarray): of shape (3,) or (N, 3)
             degrees (bool, optional): Whether the input angles are in degrees. Defaults to True.
 
         Returns:
-            np.ndarray: Rotation matrix 3x3.
+            np.ndarray: Rotation matrix 3x3, or of shape (N, 3, 3).
         """
-        x, y, z = -euler[1], -euler[2], -euler[0]
-        return euler_to_rot_matrix([x, y, z], order='xyz', degrees=degrees)
+        # (roll, pitch, yaw) ==> (-pitch, -yaw, -roll)
+        euler = -np.asarray(euler, dtype=np.float64)[..., [1, 2, 0]]
+        return quat_to_rot_matrix(euler_xyz_to_quat(euler, degrees=degrees), order='xyzw')
 
     @classmethod
     def quat_from_ue(cls, quat) -> np.ndarray:
@@ -279,7 +223,7 @@ class ConverterUnreal:
         rot_unreal = cls.unreal2opencv @ rot_unreal @ cls.unreal2opencv.T
         # TODO: make sure it's a issue of unreal or between unreal and smplx
         # XXX: rotate 90 degree around y-axis
-        rot = euler_to_rot_matrix([0, 90.0, 0.0], 'xyz', degrees=True) @ rot_unreal
+        rot = cls.rotation_offset_y90 @ rot_unreal
         return rot.T
 
     @classmethod
@@ -1,5 +1,6 @@
 """Remote functions for blender."""
 
+import os
 from pathlib import Path
 from typing import Dict, List, Literal, Optional, Tuple
 
@@ -46,7 +47,7 @@ def import_file(file_path: 'PathLike') -> None:
         For fbx file, only support binary format. ASCII format is not supported.
         Ref: https://docs.blender.org/manual/en/3.6/addons/import_export/scene_fbx.html#id4
     """
-    file_type = Path(file_path).suffix[1:].lower()  # remove dot, lower case
+    file_type = os.path.splitext(file_path)[1][1:].lower()  # remove dot, lower case
     try:
         file_type = ImportFileFormatEnum[file_type]
     except KeyError:
@@ -320,7 +321,7 @@ def check_sequence(seq_name: str) -> bool:
     Returns:
         bool: True if the sequence exists.
     """
-    return seq_name in bpy.data.collections.keys()
+    return seq_name in bpy.data.collections
 
 
 @remote_blender()
@@ -335,13 +336,13 @@ def init_scene_and_collection(name: str, cleanup: bool = False) -> None:
         XRFeitoriaBlenderFactory.delete_all()
         cleanup_unused()
     # get or create collection
-    if name not in bpy.data.collections.keys():
+    if name not in bpy.data.collections:
         _collection = XRFeitoriaBlenderFactory.new_collection(name)
     else:
         _collection = XRFeitoriaBlenderFactory.get_collection(name)
 
     # get or create scene
-    if name not in bpy.data.scenes.keys():
+    if name not in bpy.data.scenes:
         if cleanup:
             _scene = XRFeitoriaBlenderFactory.get_active_scene()
             _scene.name = name
@@ -20,17 +20,17 @@ def project_points3d(points3d: np.ndarray, camera_param: CameraParameter) -> np.
     Returns:
         np.ndarray: [N, 2] projected 2d points, dtype=np.float32
     """
-    points3d = np.concatenate([points3d, np.ones((points3d.shape[0], 1))], axis=1)  # [N, 4]
-
-    # convert to opencv convention, and cam2world
-    _camera_param = camera_param.clone()
-    if not _camera_param.world2cam:
-        _camera_param.inverse_extrinsic()
-    if _camera_param.convention != 'opencv':
-        _camera_param.convert_convention(dst='opencv')
-    point2d = _camera_param.projection_matrix @ points3d.T  # [3, N]
-    point2d = point2d[:2] / point2d[2]  # [2, N]
-    return point2d.T
+    # convert to opencv convention, and world2cam
+    _camera_param = camera_param
+    if not camera_param.world2cam or camera_param.convention != 'opencv':
+        _camera_param = camera_param.clone()
+        if not _camera_param.world2cam:
+            _camera_param.inverse_extrinsic()
+        if _camera_param.convention != 'opencv':
+            _camera_param.convert_convention(dst='opencv')
+    P = _camera_param.projection_matrix  # [3, 4]
+    point2d = points3d @ P[:, :3].T + P[:, 3]  # [N, 3]
+    return point2d[:, :2] / point2d[:, 2:3]
 
 
 def points2d_to_canvas(points2d: np.ndarray, resolution: Tuple[int, int]) -> np.ndarray:
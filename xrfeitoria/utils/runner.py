@@ -1,5 +1,6 @@
 """Runner for starting blender or unreal as a rpc server."""
 
+import atexit
 import json
 import os
 import platform
@@ -41,6 +42,8 @@ from .setup import get_exec_path
 # XXX: hardcode download url
 dist_root = os.environ.get('XRFEITORIA__DIST_ROOT') or 'https://github.com/openxrlab/xrfeitoria/releases/download'
 plugin_infos_json = Path(__file__).parent.resolve() / 'plugin_infos.json'
+# keep engine processes started by a runner alive after `close()`, and reuse them in later `init_*` calls
+runner_reuse = os.environ.get('XRF_RUNNER_REUSE', '0') == '1'
 plugin_info_type = TypedDict(
     'PluginInfo',
     {
@@ -62,6 +65,40 @@ def _rmtree(path: Path) -> None:
         shutil.rmtree(path, ignore_errors=True)
 
 
+@lru_cache(maxsize=64)
+def _validated_path(path: str, is_file: bool = False) -> Path:
+    """Resolve the path and check that it exists. Valid paths are cached, so
+    re-initializing with the same paths does not stat them again.
+
+    Args:
+        path (str): path to validate.
+        is_file (bool, optional): whether the path should be a file. Defaults to False.
+
+    Raises:
+        FileNotFoundError: if the path does not exist, or is not a file when ``is_file=True``.
+
+    Returns:
+        Path: resolved path.
+    """
+    _path = Path(path).resolve()
+    if not (_path.is_file() if is_file else _path.exists()):
+        raise FileNotFoundError(_path.as_posix())
+    return _path
+
+
+# runners whose engine process is kept alive, keyed by (engine_type, engine_exec, project_path)
+_runner_pool: 'Dict[Tuple[EngineEnum, str, str], RPCRunner]' = {}
+
+
+@atexit.register
+def _stop_pooled_runners() -> None:
+    """Stop the engine processes kept alive in the runner pool."""
+    while _runner_pool:
+        _, runner = _runner_pool.popitem()
+        runner._pool_key = None
+        runner.stop()
+
+
 def _get_user_addon_path(version: str) -> Path:
     """Get user addon path depending on platform.
 
@@ -124,6 +161,19 @@ class RPCRunner(ABC):
         self.thread_engine_alive: Optional[threading.Thread] = None
         self.thread_receive_stdout: Optional[threading.Thread] = None
 
+        self._pool_key = (self.engine_type, str(engine_exec), str(project_path)) if runner_reuse else None
+        if self._pool_key is not None:
+            # an engine kept alive with other settings would be picked up by `reuse()`, stop it first,
+            # and stop the one with the same settings too if a fresh process is asked for by `new_process=True`
+            for key in [
+                k for k in _runner_pool if k[0] == self.engine_type and (k != self._pool_key or self.new_process)
+            ]:
+                runner = _runner_pool.pop(key)
+                runner._pool_key = None
+                process = runner.engine_process
+                runner.stop()
+                process.wait()  # release the RPC port before `reuse()` tests the connection
+
         if reload_rpc_code:
             # clear registered functions and classes for reloading
             factory.RPCFactory.registered_function_names.clear()
@@ -145,19 +195,21 @@ class RPCRunner(ABC):
         if not self.new_process and self.replace_plugin:
             logger.warning('`replace_plugin=True` will be ignored when `new_process=False`')
         # Initialize for new process
-        if engine_exec:
-            self.engine_exec = Path(engine_exec).resolve()
-        else:
-            self.engine_exec = get_exec_path(engine=self.engine_type)
-        if not self.engine_exec.exists() or not self.engine_exec.is_file():
-            raise FileExistsError(f'Engine executable not valid: {self.engine_exec}')
+        if not engine_exec:
+            engine_exec = get_exec_path(engine=self.engine_type)
+        try:
+            self.engine_exec = _validated_path(str(engine_exec), is_file=True)
+        except FileNotFoundError as e:
+            raise FileExistsError(f'Engine executable not valid: {e}') from None
         logger.info(f'Using engine executable: "{self.engine_exec.as_posix()}"')
         if project_path:
-            self.project_path = Path(project_path).resolve()
-            assert self.project_path.exists(), (
-                f'Project path is not valid: "{self.project_path.as_posix()}"\n'
-                'Please check `xf.init_blender(project_path=...)` or `xf.init_unreal(project_path=...)`'
-            )
+            try:
+                self.project_path = _validated_path(str(project_path))
+            except FileNotFoundError as e:
+                raise FileNotFoundError(
+                    f'Project path is not valid: "{e}"\n'
+                    'Please check `xf.init_blender(project_path=...)` or `xf.init_unreal(project_path=...)`'
+                ) from None
             if self.engine_type == EngineEnum.blender:
                 assert self.project_path.suffix == '.blend', (
                     f'Project path is not valid: "{self.project_path.as_posix()}"\n'
@@ -198,10 +250,25 @@ class RPCRunner(ABC):
     #         self.stop()
 
     def stop(self) -> None:
-        """Stop rpc server."""
+        """Stop rpc server.
+
+        If the environment variable ``XRF_RUNNER_REUSE=1`` is set, the engine process
+        started by this runner is kept alive and reused by the following ``init_*`` calls
+        with ``new_process=False``, and it is stopped when the python interpreter exits.
+        """
         # clear rpc server
         factory.RPCFactory.clear()
 
+        if self._pool_key is not None and self.engine_process is not None:
+            # stop watching the engine, the stdout thread keeps draining the pipe of the pooled process
+            self.engine_running = False
+            _runner_pool[self._pool_key] = self
+            # the pooled process is no longer owned by this runner
+            _tls.cache['engine_process'] = None
+            _tls.cache['engine_pid'] = None
+            logger.info(':bell: [bold red]Exiting runner[/bold red], engine process kept alive for reuse')
+            return
+
         # stop threads
         self.engine_running = False
         if self.thread_receive_stdout:
@@ -234,13 +301,26 @@ class RPCRunner(ABC):
             bool: whether the engine process is reused.
 
         Raises:
-            RuntimeError: if `new_process=True` but an existing engine process is found.
+            RuntimeError: if `new_process=True` but an existing engine process is found,
+                which is not kept alive in the runner pool.
         """
         try:
             with self.console.status('[bold green]Try to reuse existing engine process...[/bold green]'):
                 self.test_connection(debug=self.debug)
                 self.engine_pid = self.get_pid()
             logger.info(':direct_hit: [bold cyan]Reuse[/bold cyan] existing engine process')
+            # take over the engine process kept alive in the pool,
+            # with `new_process=True` it has already been stopped in `__init__`
+            pooled = _runner_pool.pop(self._pool_key, None) if self._pool_key is not None else None
+            if pooled is not None:
+                pooled._pool_key = None
+                self.engine_process = pooled.engine_process
+                self.engine_pid = pooled.engine_pid
+                self.engine_outputs = pooled.engine_outputs
+                _tls.cache['engine_process'] = self.engine_process
+                _tls.cache['engine_pid'] = self.engine_pid
+                self.new_process = False
+                return True
             # raise an error if new_process is True
             if self.new_process:
                 raise RuntimeError(
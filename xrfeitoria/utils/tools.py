@@ -32,6 +32,8 @@ class LoggerWrapper:
     """A wrapper for logger tools."""
 
     is_setup = False
+    # minimum level number accepted by the configured sinks, None before `setup_logging`
+    min_level_no = None
     logger_record = set()
     # ^8 means center align, 8 characters
     logger_format = '{time:YYYY-MM-DD HH:mm:ss} | ' + '{level:^8} | ' + '{message}'
@@ -100,6 +102,7 @@ class LoggerWrapper:
         #     log_time_format='',
         # )
         logger.add(sink=lambda msg: get_console().print(msg, end=''), level=level, format=cls.logger_format)
+        cls.min_level_no = logger.level(level).no
         if log_path:
             # add file logger
             log_path = Path(log_path).resolve()
@@ -108,6 +111,7 @@ class LoggerWrapper:
                 log_path.unlink(missing_ok=True)
             _level = 'RPC' if level == 'RPC' else 'TRACE'
             logger.add(log_path, level=_level, filter=cls.filter_unique, format=cls.logger_format, encoding='utf-8')
+            cls.min_level_no = min(cls.min_level_no, logger.level(_level).no)
             logger.info(f'Python Logging to "{log_path.as_posix()}"')
         cls.is_setup = True
         return logger
@@ -8,19 +8,22 @@ __all__ = ['Validator']
 
 class Validator:
     @classmethod
-    def validate_argument_type(cls, value, typelist: List[Type]) -> None:
+    def validate_argument_type(cls, value, typelist: Union[Type, List[Type], Tuple[Type, ...]]) -> None:
         """Validate the type of an argument.
 
         Args:
             value (Any): The value to be validated.
-            typelist (List[Type]): The list of types to be validated.
+            typelist (Union[Type, List[Type], Tuple[Type, ...]]): The type or types to be validated.
 
         Raises:
             TypeError: If the type of the argument is not in the typelist.
         """
-        if not isinstance(typelist, list):
-            typelist = [typelist]
-        if any([isinstance(value, tp) for tp in typelist]):
+        if isinstance(typelist, list):
+            typelist = tuple(typelist)
+        elif not isinstance(typelist, tuple):
+            typelist = (typelist,)
+        # a single isinstance call with a tuple of types, instead of one call per type
+        if isinstance(value, typelist):
             return
         raise TypeError(
             f'Invalid argument type, expected {[tp.__name__ for tp in typelist]} (got {value.__class__.__name__} instead).'
@@ -38,15 +41,41 @@ class Validator:
             TypeError: If the type of the argument is not a vector,
                 or the length of the vector is not equal to the given length.
         """
-        cls.validate_argument_type(value=value, typelist=[list, tuple])
+        cls.validate_argument_type(value=value, typelist=(list, tuple))
         if len(value) != length:
-            raise ValueError(f'Invalid vector length, expected 3 (got {len(value)} instead)')
+            raise ValueError(f'Invalid vector length, expected {length} (got {len(value)} instead)')
         for val in value:
             if not isinstance(val, float) and not isinstance(val, int):
                 raise TypeError(
                     f"Invalid argument type, expected 'float' vector or 'int' vector (got '{val.__class__.__name__}' in vector instead)."
                 )
 
+    @classmethod
+    def validate_vectors(cls, values: List, length: int, allow_none: bool = False) -> None:
+        """Validate the type and length of several vectors in one call.
+
+        Args:
+            values (List): The vectors to be validated, e.g. ``[location, rotation, scale]``.
+            length (int): The length of each vector.
+            allow_none (bool, optional): Skip vectors that are ``None`` or empty, i.e. not given.
+                Defaults to False.
+
+        Raises:
+            TypeError: If the type of any argument is not a vector.
+            ValueError: If the length of any vector is not equal to the given length.
+        """
+        for value in values:
+            if allow_none and not value:
+                continue
+            # fast path for valid vectors, `validate_vector` is only called to raise the detailed error
+            if (
+                isinstance(value, (list, tuple))
+                and len(value) == length
+                and all(isinstance(val, (float, int)) for val in value)
+            ):
+                continue
+            cls.validate_vector(value, length)
+
 
 def get_variable_name(_type: Any) -> str:
     """Get the variable name as a string."""